@@ -25,13 +25,24 @@ import tempfile
 import time
 from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urlparse
 
 import pyarrow as pa
+import pyarrow.json as pa_json
 import pyarrow.parquet as pq
 from tqdm import tqdm
 
+# ISA-L's igzip decompresses the same streams two to four times faster than
+# zlib and mirrors the gzip module's API, so it is a drop-in when installed.
+# Decompression, not parsing, is most of the time spent reading the ~23 GB of
+# source files.
+try:
+    from isal import igzip as gzip_mod
+except ImportError:
+    gzip_mod = gzip
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s",
@@ -122,16 +133,128 @@ def safe_list(val):
 
 
 def stream_jsonl_gz(path: str):
-    """Yield parsed dicts from a gzip JSONL file."""
-    with gzip.open(path, "rt", encoding="utf-8") as f:
-        for lineno, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                logger.debug("Skipping invalid JSON on line %d", lineno)
+    """
+    Yield parsed dicts from a gzip JSONL file.
+
+    Malformed lines are skipped and reported once, as a count with the first
+    few line numbers, when the file is finished (or abandoned). A line-by-line
+    report buried the summary under thousands of identical messages, and
+    formatting each one cost more than the skip.
+    """
+    bad = 0
+    first_bad = []
+    try:
+        # Binary mode: json.loads takes UTF-8 bytes directly, so text-mode
+        # decoding of every line would only be thrown away.
+        with gzip_mod.open(path, "rb") as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:  # JSONDecodeError, or bytes that are not UTF-8
+                    bad += 1
+                    if len(first_bad) < 5:
+                        first_bad.append(lineno)
+                    continue
+                yield record
+    finally:
+        if bad:
+            logger.warning(
+                "Skipped %d malformed JSON line(s) in %s (first at line(s) %s)",
+                bad, path, ", ".join(map(str, first_bad)),
+            )
+
+
+# Source fields phase 2 reads from each turn record. Declaring them lets
+# Arrow's JSON reader skip every other field instead of inferring a type for
+# it and materialising it.
+TURN_SOURCE_SCHEMA = pa.schema([
+    ("mp3url", pa.string()),
+    ("speaker", pa.list_(pa.string())),
+    ("turnText", pa.string()),
+    ("startTime", pa.float64()),
+    ("endTime", pa.float64()),
+    ("duration", pa.float64()),
+    ("turnCount", pa.int64()),
+    ("inferredSpeakerRole", pa.string()),
+    ("inferredSpeakerName", pa.string()),
+    ("mfcc1_sma3Mean", pa.float64()),
+    ("mfcc2_sma3Mean", pa.float64()),
+    ("mfcc3_sma3Mean", pa.float64()),
+    ("mfcc4_sma3Mean", pa.float64()),
+    ("F0semitoneFrom27.5Hz_sma3nzMean", pa.float64()),
+    ("F1frequency_sma3nzMean", pa.float64()),
+])
+
+
+def _schema_record(schema: pa.Schema):
+    """
+    Return a function shaping a :func:`stream_jsonl_gz` record the way Arrow's
+    reader yields one for ``schema``: exactly the schema's fields, None for the
+    missing ones, and numbers as the declared int or float type. Values of any
+    other type are left for the caller's ``safe_*`` helpers, as they would have
+    been before the fallback.
+    """
+    names = schema.names
+    ints = [f.name for f in schema if pa.types.is_integer(f.type)]
+    floats = [f.name for f in schema if pa.types.is_floating(f.type)]
+
+    def shape(record: dict) -> dict:
+        out = {name: record.get(name) for name in names}
+        for name in ints:
+            val = out[name]
+            if type(val) is float and val.is_integer():
+                out[name] = int(val)
+        for name in floats:
+            val = out[name]
+            if type(val) is int:
+                out[name] = float(val)
+        return out
+
+    return shape
+
+
+def stream_jsonl_gz_columns(path: str, schema: pa.Schema, *,
+                            block_size: int = 8 << 20):
+    """
+    Yield dicts holding the fields of ``schema`` from a gzip JSONL file.
+
+    Parsing runs in Arrow's multithreaded C++ JSON reader, a block at a time,
+    which is several times faster than ``json.loads`` per line over the 22M
+    turn records. Fields missing from a record come back as None.
+
+    Arrow rejects a whole block for one malformed line or one value of the
+    wrong type (a bare string where the schema has a list, say). When that
+    happens the file is finished with :func:`stream_jsonl_gz`, skipping the
+    records already yielded, and each record is shaped to ``schema`` as Arrow
+    would have shaped it, so the output is the same either way -- only the bad
+    lines are dropped, and they are reported as usual.
+
+    ``block_size`` is the uncompressed size, in bytes, Arrow parses at a time.
+    """
+    yielded = 0
+    try:
+        reader = pa_json.open_json(
+            pa.input_stream(path, compression="gzip"),
+            read_options=pa_json.ReadOptions(use_threads=True, block_size=block_size),
+            parse_options=pa_json.ParseOptions(
+                explicit_schema=schema, unexpected_field_behavior="ignore",
+            ),
+        )
+        for batch in reader:
+            for record in batch.to_pylist():
+                yielded += 1
+                yield record
+        return
+    except pa.ArrowInvalid as e:
+        logger.warning(
+            "Arrow could not parse %s (%s); reading the rest line by line "
+            "from record %d", path, e, yielded,
+        )
+    yield from map(_schema_record(schema),
+                   islice(stream_jsonl_gz(path), yielded, None))
 
 
 # ---------------------------------------------------------------------------
@@ -426,7 +549,8 @@ def phase2_turns(turn_file: str, output_dir: str, mp3url_to_pid: dict):
         buffer_counts[pid] = 0
         flushed_pids.add(pid)
 
-    pbar = tqdm(stream_jsonl_gz(turn_file), desc="Phase 2: Turns", unit=" records",
+    records = stream_jsonl_gz_columns(turn_file, TURN_SOURCE_SCHEMA)
+    pbar = tqdm(records, desc="Phase 2: Turns", unit=" records",
                 total=22_000_000, dynamic_ncols=True)
     for rec in pbar:
         record_count += 1
@@ -445,8 +569,12 @@ def phase2_turns(turn_file: str, output_dir: str, mp3url_to_pid: dict):
         matched_count += 1
 
         eid = episode_id_from_mp3(mp3url)
-        speaker = rec.get("speaker", [])
-        if isinstance(speaker, str):
+        # Absent and null both mean no speaker; the Arrow reader cannot tell
+        # them apart, so neither does this.
+        speaker = rec.get("speaker")
+        if speaker is None:
+            speaker = []
+        elif isinstance(speaker, str):
             speaker = [speaker]
 
         # Text row
@@ -740,7 +740,8 @@ class SPORCDataset:
                      podcast_id: Optional[str] = None,
                      episode_id: Optional[str] = None,
                      speaker_role: Optional[str] = None,
-                     limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+                     limit: int = 100, offset: int = 0,
+                     as_table: bool = False) -> Any:
         """
         Search turn text across the corpus using full-text search.
 
@@ -752,14 +753,16 @@ class SPORCDataset:
             speaker_role: Filter by speaker role.
             limit: Maximum results to return.
             offset: Number of results to skip.
+            as_table: Return a ``pyarrow.Table`` instead of dicts. Worth it
+                for large limits, where building a dict per hit dominates.
 
         Returns:
-            List of turn dicts with score.
+            List of turn dicts with score, or a table of the same columns.
         """
         return self._parquet_backend.search_turns(
             query, mode=mode, podcast_id=podcast_id,
             episode_id=episode_id, speaker_role=speaker_role,
-            limit=limit, offset=offset,
+            limit=limit, offset=offset, as_table=as_table,
         )
 
     def search_episodes_by_text(self, query: str, *, mode: str = "fts",
@@ -779,6 +782,27 @@ class SPORCDataset:
             query, mode=mode, limit=limit,
         )
 
+    def search_episodes_by_text_batch(self, queries: List[str], *,
+                                      mode: str = "fts", limit: int = 100
+                                      ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run :meth:`search_episodes_by_text` for several queries at once.
+
+        In "exact" mode the queries share one read of the turn text instead of
+        one read each.
+
+        Args:
+            queries: Search query strings.
+            mode: "fts" (BM25 ranked), "exact" (ILIKE), or "regex".
+            limit: Maximum number of episodes per query.
+
+        Returns:
+            Dict mapping each distinct query to its list of episode dicts.
+        """
+        return self._parquet_backend.search_episodes_by_text_batch(
+            queries, mode=mode, limit=limit,
+        )
+
     def search_by_speaker_name(self, name: str, *, role: Optional[str] = None,
                                exact: bool = False,
                                limit: int = 100) -> List[Dict[str, Any]]:
@@ -8,9 +8,12 @@ from datetime import datetime, timezone
 from bisect import bisect_left, bisect_right
 import hashlib
 import json
+from collections import Counter
 from enum import Enum
 
-from .turn import Turn
+import numpy as np
+
+from .turn import Turn, _SLOTS
 from .exceptions import NotFoundError
 
 
@@ -141,7 +144,7 @@ class TurnWindow:
                 f"overlap_size={self.overlap_size})")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Episode:
     """
     Represents a single podcast episode with metadata and conversation turns.
@@ -208,6 +211,14 @@ class Episode:
     _has_turn_data: Optional[bool] = field(default=None, repr=False)
     _turn_data_check: Optional[Callable] = field(default=None, repr=False)
 
+    # Per-turn numeric columns derived from _turns; see _turn_columns. Not
+    # compared: two episodes with the same turns are equal whether or not
+    # either has built its columns yet.
+    _turn_columns_cache: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False)
+    _turn_columns_source: Optional[List[Turn]] = field(
+        default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate episode data after initialization."""
         if not self.title.strip():
@@ -433,27 +444,34 @@ class Episode:
         if end_time > self.duration_seconds:
             end_time = self.duration_seconds
 
+        turns = self._turns
+        return [turns[i] for i in
+                self._time_range_indices(start_time, end_time, behavior).tolist()]
+
+    def _time_range_indices(self, start_time: float, end_time: float,
+                            behavior: TimeRangeBehavior) -> "np.ndarray":
+        """
+        Indices into ``_turns`` of the turns selected by a time range.
+
+        Masks over the cached time columns rather than a comparison per Turn
+        in Python; on a long episode this is most of the cost of a range query.
+        The caller clamps the range first.
+        """
+        cols = self._turn_columns()
+        starts, ends = cols['start_time'], cols['end_time']
         if behavior == TimeRangeBehavior.STRICT:
             # Only include turns that are completely within the time range
-            return [
-                turn for turn in self._turns
-                if turn.start_time >= start_time and turn.end_time <= end_time
-            ]
+            mask = (starts >= start_time) & (ends <= end_time)
         elif behavior == TimeRangeBehavior.INCLUDE_PARTIAL:
             # Include turns that overlap with the time range
-            return [
-                turn for turn in self._turns
-                if turn.start_time < end_time and turn.end_time > start_time
-            ]
+            mask = (starts < end_time) & (ends > start_time)
         elif behavior == TimeRangeBehavior.INCLUDE_FULL_TURNS:
             # Include complete turns even if they extend beyond the time range
             # Find turns that start before the end time and end after the start time
-            return [
-                turn for turn in self._turns
-                if turn.start_time < end_time and turn.end_time > start_time
-            ]
+            mask = (starts < end_time) & (ends > start_time)
         else:
             raise ValueError(f"Unknown behavior: {behavior}")
+        return np.flatnonzero(mask)
 
     def get_turns_by_time_range_with_trimming(self, start_time: float, end_time: float,
                                              behavior: TimeRangeBehavior = TimeRangeBehavior.INCLUDE_PARTIAL) -> List[Dict[str, Any]]:
@@ -494,37 +512,39 @@ class Episode:
         if end_time > self.duration_seconds:
             end_time = self.duration_seconds
 
-        turns = self.get_turns_by_time_range(start_time, end_time, behavior)
-        result = []
+        idx = self._time_range_indices(start_time, end_time, behavior)
+        turns = self._turns
+
+        # Only INCLUDE_PARTIAL trims. STRICT turns lie wholly inside the range
+        # already, and INCLUDE_FULL_TURNS keeps turns whole by definition. The
+        # clipping is done for all selected turns at once on the time columns,
+        # leaving the loop below to do nothing but build the dicts.
+        if behavior == TimeRangeBehavior.INCLUDE_PARTIAL:
+            cols = self._turn_columns()
+            starts, ends = cols['start_time'][idx], cols['end_time'][idx]
+            trimmed = ((starts < start_time) | (ends > end_time)).tolist()
+            trimmed_starts = np.maximum(starts, start_time).tolist()
+            trimmed_ends = np.minimum(ends, end_time).tolist()
+        else:
+            trimmed = [False] * len(idx)
 
-        for turn in turns:
-            turn_data = {
+        result = []
+        for k, i in enumerate(idx.tolist()):
+            turn = turns[i]
+            # Note: actual text trimming would require word-level timing data,
+            # so the text is passed through whole and only the times are cut.
+            if trimmed[k]:
+                t_start, t_end = trimmed_starts[k], trimmed_ends[k]
+            else:
+                t_start, t_end = turn.start_time, turn.end_time
+            result.append({
                 'turn': turn,
                 'trimmed_text': turn.text,
                 'original_text': turn.text,
-                'trimmed_start': turn.start_time,
-                'trimmed_end': turn.end_time,
-                'was_trimmed': False
-            }
-
-            # For STRICT behavior, we might want to trim text to the exact time range
-            if behavior == TimeRangeBehavior.STRICT:
-                # The turn should be completely within the range, so no trimming needed
-                pass
-            elif behavior == TimeRangeBehavior.INCLUDE_PARTIAL:
-                # For partial inclusion, we could trim text to the time range
-                # This is a simplified approach - in practice, you might want more sophisticated text trimming
-                if turn.start_time < start_time or turn.end_time > end_time:
-                    turn_data['was_trimmed'] = True
-                    turn_data['trimmed_start'] = max(turn.start_time, start_time)
-                    turn_data['trimmed_end'] = min(turn.end_time, end_time)
-                    # Note: Actual text trimming would require word-level timing data
-                    # This is a placeholder for the concept
-            elif behavior == TimeRangeBehavior.INCLUDE_FULL_TURNS:
-                # Include the full turn, no trimming
-                pass
-
-            result.append(turn_data)
+                'trimmed_start': t_start,
+                'trimmed_end': t_end,
+                'was_trimmed': trimmed[k],
+            })
 
         return result
 
@@ -568,7 +588,13 @@ class Episode:
                 "demand; this episode has no turn loader attached."
             )
 
-        return [turn for turn in self._turns if turn.word_count >= min_length]
+        # Binary search over the word-count-sorted index, so each call touches
+        # only the turns it returns rather than recounting the words of every
+        # turn. Indices go back through np.sort to keep episode order.
+        cols = self._turn_columns()
+        cut = int(np.searchsorted(cols['word_count_sorted'], min_length, side='left'))
+        turns = self._turns
+        return [turns[i] for i in np.sort(cols['word_count_order'][cut:]).tolist()]
 
     def get_turns_by_role(self, role: str) -> List[Turn]:
         """
@@ -806,7 +832,7 @@ class Episode:
         total_windows = max(1, (total_turns - window_size) // step_size + 1)
 
         # Calculate average window duration
-        total_duration = sum(turn.duration for turn in self._turns)
+        total_duration = float(self._turn_columns()['duration'].sum())
         avg_turn_duration = total_duration / total_turns if total_turns > 0 else 0
         avg_window_duration = avg_turn_duration * window_size
 
@@ -821,6 +847,49 @@ class Episode:
             'avg_turn_duration': avg_turn_duration,
         }
 
+    def _turn_columns(self) -> Dict[str, Any]:
+        """
+        The turns' numeric fields as NumPy arrays, parallel to ``_turns``.
+
+        Built on first use and reused until ``_turns`` changes. Summaries over
+        a long episode then cost one vectorised reduction rather than a
+        Python loop through thousands of Turn objects per call.
+
+        ``_turns`` is assigned directly by the backend (and by tests), and on
+        occasion appended to in place, so the columns are checked against the
+        list object and its length rather than invalidated by a setter. The
+        list is held, not its id, so a freed list's address being reused
+        cannot pass for the current one.
+
+        Returns:
+            Dict with ``start_time``, ``end_time``, ``duration`` (float64) and
+            ``word_count`` (int64) arrays, plus ``word_count_order``, the
+            turn indices sorted by word count, and ``word_count_sorted``, the
+            word counts in that order.
+        """
+        turns = self._turns
+        cols = self._turn_columns_cache
+        if (cols is None or self._turn_columns_source is not turns
+                or len(cols['duration']) != len(turns)):
+            n = len(turns)
+            cols = {
+                'start_time': np.fromiter((t.start_time for t in turns),
+                                          dtype=np.float64, count=n),
+                'end_time': np.fromiter((t.end_time for t in turns),
+                                        dtype=np.float64, count=n),
+                'duration': np.fromiter((t.duration for t in turns),
+                                        dtype=np.float64, count=n),
+                'word_count': np.fromiter((t.word_count for t in turns),
+                                          dtype=np.int64, count=n),
+            }
+            # Stable, so turns of equal length keep their episode order.
+            order = np.argsort(cols['word_count'], kind='stable')
+            cols['word_count_order'] = order
+            cols['word_count_sorted'] = cols['word_count'][order]
+            self._turn_columns_cache = cols
+            self._turn_columns_source = turns
+        return cols
+
     def _ensure_turns_loaded(self) -> None:
         """Load turns via the turn loader if available and not yet loaded."""
         if not self._turns_loaded and self._turn_loader is not None:
@@ -867,7 +936,7 @@ class Episode:
                 "Turns not loaded. Episodes from SPORCDataset load turns on "
                 "demand; this episode has no turn loader attached."
             )
-        return self._turns.copy()
+        return list(self._turns)
 
     @property
     def turn_count(self) -> int:
@@ -912,7 +981,7 @@ class Episode:
                 "Turns not loaded. Episodes from SPORCDataset load turns on "
                 "demand; this episode has no turn loader attached."
             )
-        return self._turns.copy()
+        return list(self._turns)
 
     def get_turn_statistics(self) -> Dict[str, Any]:
         """
@@ -938,20 +1007,16 @@ class Episode:
                 'role_distribution': {},
             }
 
-        total_words = sum(turn.word_count for turn in self._turns)
-        total_duration = sum(turn.duration for turn in self._turns)
+        cols = self._turn_columns()
+        total_words = int(cols['word_count'].sum())
+        total_duration = float(cols['duration'].sum())
 
-        # Speaker distribution
-        speaker_counts = {}
-        for turn in self._turns:
-            for speaker in turn.speaker:
-                speaker_counts[speaker] = speaker_counts.get(speaker, 0) + 1
-
-        # Role distribution
-        role_counts = {}
-        for turn in self._turns:
-            role = turn.inferred_speaker_role or "unknown"
-            role_counts[role] = role_counts.get(role, 0) + 1
+        # Speaker and role labels are strings, so they are counted rather than
+        # vectorised; Counter keeps the loop in C.
+        speaker_counts = dict(Counter(
+            speaker for turn in self._turns for speaker in turn.speaker))
+        role_counts = dict(Counter(
+            turn.inferred_speaker_role or "unknown" for turn in self._turns))
 
         return {
             'total_turns': len(self._turns),
@@ -967,28 +1032,35 @@ class Episode:
         Convert the episode to a dictionary representation.
 
         Returns:
-            Dictionary representation of the episode
+            Dictionary representation of the episode. A fresh copy each call,
+            safe to modify.
         """
+        episode_date = self.episode_date
+        host_names = list(self.host_names)
+        guest_names = list(self.guest_names)
+        num_hosts = len(host_names)
+        num_guests = len(guest_names)
+        duration_minutes = self.duration_minutes
         return {
             'title': self.title,
             'description': self.description,
             'mp3_url': self.mp3_url,
             'duration_seconds': self.duration_seconds,
-            'duration_minutes': self.duration_minutes,
+            'duration_minutes': duration_minutes,
             'podcast_title': self.podcast_title,
             'categories': self.categories,
-            'host_names': self.host_names,
-            'guest_names': self.guest_names,
-            'num_hosts': self.num_hosts,
-            'num_guests': self.num_guests,
+            'host_names': host_names,
+            'guest_names': guest_names,
+            'num_hosts': num_hosts,
+            'num_guests': num_guests,
             'num_main_speakers': self.num_main_speakers,
-            'is_long_form': self.is_long_form,
-            'is_short_form': self.is_short_form,
-            'has_guests': self.has_guests,
-            'is_solo': self.is_solo,
-            'is_interview': self.is_interview,
-            'is_panel': self.is_panel,
-            'episode_date': self.episode_date.isoformat() if self.episode_date else None,
+            'is_long_form': duration_minutes > 30,
+            'is_short_form': duration_minutes < 10,
+            'has_guests': num_guests > 0,
+            'is_solo': num_hosts == 1 and num_guests == 0,
+            'is_interview': num_hosts >= 1 and num_guests >= 1,
+            'is_panel': (num_hosts + num_guests) > 2,
+            'episode_date': episode_date.isoformat() if episode_date else None,
             'quality_indicators': {
                 'overlap_prop_duration': self.overlap_prop_duration,
                 'overlap_prop_turn_count': self.overlap_prop_turn_count,
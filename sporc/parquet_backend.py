@@ -6,6 +6,8 @@ per-podcast partitioned data on demand, providing O(1) lookups by podcast,
 hostname, and category.
 """
 
+import copy
+import functools
 import hashlib
 import json
 import logging
@@ -13,15 +15,32 @@ import os
 import pickle
 import random
 import re
+import sys
 import time
 import warnings
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.feather as feather
 import pyarrow.parquet as pq
 
+# orjson decodes straight from bytes and runs several times faster than the
+# stdlib parser. Optional: every call site goes through _json_loads, which
+# falls back to json when orjson is absent.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Hyperscan finds the rows that may contain a literal in one SIMD pass over an
+# Arrow column's packed text buffer. Optional; see _substring_mask.
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on the environment
+    hyperscan = None
+
 from .episode import Episode
 from .exceptions import DatasetAccessError, IndexNotBuiltError, NotFoundError
 from .podcast import Podcast
@@ -30,6 +49,31 @@ from .turn import Turn
 
 logger = logging.getLogger(__name__)
 
+
+# A digit run long enough that the integer may not fit in 64 bits. Some orjson
+# releases raise on those, others quietly parse them as floats.
+_WIDE_INT_STR = re.compile(r"\d{19}")
+_WIDE_INT_BYTES = re.compile(rb"\d{19}")
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, with orjson when it is installed.
+
+    orjson is stricter than the stdlib: it rejects NaN/Infinity and integers
+    wider than 64 bits, which json.loads accepts. Those inputs go to json, so
+    installing orjson never changes what parses or what it parses to. Raises
+    ValueError (json.JSONDecodeError) on input neither accepts.
+    """
+    if orjson is not None:
+        wide = _WIDE_INT_BYTES if isinstance(data, bytes) else _WIDE_INT_STR
+        if wide.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
 # Version tag embedded in the cache so that code changes automatically
 # invalidate stale caches.
 _CACHE_VERSION = 3
@@ -56,6 +100,19 @@ _TREE_CACHE_SIZE = 4
 # descriptor open.
 _PARQUET_HANDLE_CACHE_SIZE = 16
 
+# get_episode_metrics results held in memory, keyed on episode_id. Each miss is
+# a full-column equality scan of the metrics catalog (a row per episode, ~1.1M),
+# and the same handful of episodes tend to be asked for over and over while a
+# notebook or UI is pointed at them. A row is ~20 scalars, so this is small.
+_EPISODE_METRICS_CACHE_SIZE = 8192
+
+# Part files an unindexed scan of local turn text reads ahead in the background.
+# Reading and decompressing a part releases the GIL, so the next part can load
+# while the caller filters the current one. Each part is a whole turn-text file
+# held in memory, so peak memory during a scan grows by one part per unit here;
+# 0 reads strictly one part at a time.
+_SCAN_READ_AHEAD = 1
+
 # Everything search_episodes() knows how to filter on. Anything else is a
 # mistake on the caller's part and is refused rather than ignored.
 _EPISODE_CRITERIA = frozenset({
@@ -66,6 +123,399 @@ _EPISODE_CRITERIA = frozenset({
 })
 
 
+#: filter_episodes_by_metrics keyword stem -> episode_metrics column. Each stem
+#: takes a ``min_`` and a ``max_`` bound.
+_METRIC_FILTER_COLUMNS = (
+    ("word_count", "total_word_count"),
+    ("turn_count", "total_turn_count"),
+    ("speaking_rate", "avg_words_per_second"),
+    ("discourse_marker_rate", "discourse_marker_rate"),
+    ("host_proportion", "host_word_proportion"),
+    ("avg_gap", "avg_gap_duration"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _search_turns_sql(mode: str, by_podcast: bool, by_episode: bool,
+                      by_role: bool, has_text_db: bool) -> str:
+    """
+    The SQL behind :meth:`ParquetBackend.search_turns`, built once per shape.
+
+    The statement depends only on the mode, which filters are present and
+    whether the text database is attached -- 48 shapes at most -- so it is
+    assembled once and reused, leaving each call to bind fresh parameters.
+    Parameters bind in this order: for "fts", query, limit, offset, then the
+    filters; for "exact"/"regex", pattern, the filters, then limit, offset.
+    Filters always run podcast_id, episode_id, speaker_role.
+
+    DuckDB's Python client offers no handle to a server-side prepared
+    statement (``EXECUTE`` will not take bound parameters), so this caches the
+    text rather than the plan: reusing the plan would mean splicing literals
+    into SQL.
+    """
+    where_clauses = []
+    if by_podcast:
+        where_clauses.append("t.podcast_id = ?")
+    if by_episode:
+        where_clauses.append("t.episode_id = ?")
+    if by_role:
+        where_clauses.append("t.speaker_role = ?")
+
+    # Text comes from the attached database when it is there. Selecting it
+    # is what makes the difference between returning a snippet and returning
+    # a pointer.
+    text_col = "x.turn_text" if has_text_db else "NULL AS turn_text"
+    text_join = ("JOIN txt.turn_text x USING (episode_id, turn_count)"
+                 if has_text_db else "")
+
+    if mode == "fts":
+        # Rank first, then attach text to the handful of rows that survive.
+        # Joining before the LIMIT joins all 185M scored rows to get twenty,
+        # which measured about 20 seconds of pure waste per query.
+        inner_where = " AND ".join(c.replace("t.", "") for c in where_clauses)
+        return f"""
+            WITH top AS (
+                SELECT episode_id, podcast_id, turn_count, start_time,
+                       end_time, duration, speaker_role, speaker_name,
+                       word_count, score
+                FROM (
+                    SELECT *, fts_main_turns.match_bm25(row_id, ?) AS score
+                    FROM turns
+                )
+                WHERE score IS NOT NULL
+                {"AND " + inner_where if inner_where else ""}
+                ORDER BY score DESC
+                LIMIT ? OFFSET ?
+            )
+            SELECT top.episode_id, top.podcast_id, top.turn_count,
+                   {text_col}, top.start_time, top.end_time, top.duration,
+                   top.speaker_role, top.speaker_name, top.word_count,
+                   top.score
+            FROM top {text_join.replace("USING (episode_id, turn_count)",
+                                        "ON x.episode_id = top.episode_id "
+                                        "AND x.turn_count = top.turn_count")}
+            ORDER BY top.score DESC
+        """
+
+    # "exact" and "regex" both match on the text, so they drive from the text
+    # table and pick the metadata up afterwards. Only reached with the text
+    # database attached; without it these modes scan Parquet instead.
+    predicate = ("x.turn_text ILIKE ?" if mode == "exact"
+                 else "regexp_matches(x.turn_text, ?)")
+    return f"""
+        SELECT t.episode_id, t.podcast_id, t.turn_count, x.turn_text,
+               t.start_time, t.end_time, t.duration, t.speaker_role,
+               t.speaker_name, t.word_count, 1.0 AS score
+        FROM txt.turn_text x
+        JOIN turns t ON t.episode_id = x.episode_id
+                    AND t.turn_count = x.turn_count
+        WHERE {predicate}
+        {"AND " + " AND ".join(where_clauses) if where_clauses else ""}
+        LIMIT ? OFFSET ?
+    """
+
+
+def _substring_mask(text, query: str):
+    """
+    Case-insensitive substring test over a string column.
+
+    Same answer as ``pc.match_substring(text, query, ignore_case=True)``, which
+    is what it falls back to when hyperscan is not installed or cannot take the
+    query. With hyperscan, each chunk's text buffer is scanned as one block to
+    find candidate rows, and only those rows go through Arrow for the real
+    test. Rows are packed end to end in that buffer, so a literal can straddle
+    two of them; confirming candidates with Arrow is what keeps such a hit from
+    becoming a false positive. A row with a genuine match always becomes a
+    candidate, because hyperscan's UTF-8 case folding covers RE2's.
+    """
+    import pyarrow.compute as pc
+
+    if hyperscan is None or not query:
+        return pc.match_substring(text, query, ignore_case=True)
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[re.escape(query).encode("utf-8")], ids=[0], elements=1,
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+                   | hyperscan.HS_FLAG_UCP],
+        )
+    except hyperscan.error:
+        return pc.match_substring(text, query, ignore_case=True)
+
+    chunks = text.chunks if isinstance(text, pa.ChunkedArray) else [text]
+    masks = []
+    for chunk in chunks:
+        if (len(chunk) == 0 or chunk.null_count == len(chunk)
+                or not (pa.types.is_string(chunk.type)
+                        or pa.types.is_large_string(chunk.type))):
+            masks.append(pc.match_substring(chunk, query, ignore_case=True))
+            continue
+        masks.append(_hyperscan_chunk_mask(db, chunk, query))
+    return pa.chunked_array(masks, type=pa.bool_())
+
+
+def _hyperscan_chunk_mask(db, chunk, query: str):
+    """_substring_mask for one string array, given its compiled database."""
+    import pyarrow.compute as pc
+
+    n = len(chunk)
+    _, offsets_buf, data_buf = chunk.buffers()
+    dtype = np.int64 if pa.types.is_large_string(chunk.type) else np.int32
+    offsets = np.frombuffer(offsets_buf, dtype=dtype)[chunk.offset:chunk.offset + n + 1]
+    mask = np.zeros(n, dtype=bool)
+    pos, end = int(offsets[0]), int(offsets[-1])
+    if data_buf is None or pos == end:
+        return pa.array(mask)
+    data = memoryview(data_buf)[pos:end]
+
+    # One scan, one callback per occurrence. That is cheap for the rare words
+    # searches are usually for, and ruinous for a common one -- "the" hits
+    # most rows several times over -- so past a bound the scan gives up and
+    # the chunk goes to Arrow whole, which is no slower than not having tried.
+    limit = max(1024, n // 16)
+    hits: List[int] = []
+
+    def on_match(_id, _start, stop, _flags, _ctx):
+        hits.append(stop)
+        return len(hits) >= limit
+
+    try:
+        db.scan(data, match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        return pc.match_substring(chunk, query, ignore_case=True)
+    if not hits:
+        return pa.array(mask)
+    # A hit belongs to the row holding its last byte.
+    last_bytes = np.asarray(hits, dtype=np.int64) + (pos - 1)
+    mask[np.searchsorted(offsets, last_bytes, side="right") - 1] = True
+
+    candidates = np.flatnonzero(mask)
+    if len(candidates):
+        confirmed = pc.match_substring(
+            chunk.take(pa.array(candidates)), query, ignore_case=True)
+        mask[candidates] = confirmed.fill_null(False).to_numpy(zero_copy_only=False)
+    return pa.array(mask)
+
+
+@functools.lru_cache(maxsize=None)
+def _search_episodes_sql(mode: str) -> str:
+    """
+    The SQL behind :meth:`ParquetBackend.search_episodes_by_text`, per mode.
+
+    Cached for the reason :func:`_search_turns_sql` is: DuckDB cannot bind
+    parameters to ``EXECUTE``, so the statement text is what gets reused.
+    Parameters bind as the query (or ILIKE pattern), then the limit. "exact"
+    and "regex" read the attached text database, so they need it.
+    """
+    if mode == "fts":
+        return """
+            WITH scored AS (
+                SELECT episode_id, podcast_id,
+                       fts_main_turns.match_bm25(row_id, ?) AS score
+                FROM turns
+            )
+            SELECT episode_id, podcast_id,
+                   COUNT(*) AS match_count,
+                   MAX(score) AS best_score
+            FROM scored
+            WHERE score IS NOT NULL
+            GROUP BY episode_id, podcast_id
+            ORDER BY best_score DESC
+            LIMIT ?
+        """
+    predicate = ("x.turn_text ILIKE ?" if mode == "exact"
+                 else "regexp_matches(x.turn_text, ?)")
+    return f"""
+        SELECT t.episode_id, t.podcast_id,
+               COUNT(*) AS match_count,
+               1.0::DOUBLE AS best_score
+        FROM txt.turn_text x
+        JOIN turns t ON t.episode_id = x.episode_id
+                    AND t.turn_count = x.turn_count
+        WHERE {predicate}
+        GROUP BY t.episode_id, t.podcast_id
+        ORDER BY match_count DESC
+        LIMIT ?
+    """
+
+
+# ParquetBackend.search_episodes_by_text_batch in "exact" mode. Joining the text
+# to every query's ILIKE pattern reads the text table once for the whole batch
+# rather than once per query; the window then keeps each query's top *limit*
+# episodes. Parameters bind as the queries, their patterns and the limit.
+_SEARCH_EPISODES_BATCH_SQL = """
+    WITH q AS (
+        SELECT UNNEST(?::VARCHAR[]) AS query, UNNEST(?::VARCHAR[]) AS pattern
+    ),
+    hits AS (
+        SELECT q.query, t.episode_id, t.podcast_id, COUNT(*) AS match_count
+        FROM txt.turn_text x
+        JOIN q ON x.turn_text ILIKE q.pattern
+        JOIN turns t ON t.episode_id = x.episode_id
+                    AND t.turn_count = x.turn_count
+        GROUP BY q.query, t.episode_id, t.podcast_id
+    )
+    SELECT query, episode_id, podcast_id, match_count,
+           1.0::DOUBLE AS best_score
+    FROM hits
+    QUALIFY row_number() OVER (
+        PARTITION BY query ORDER BY match_count DESC) <= ?
+    ORDER BY query, match_count DESC
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _concordance_sql(by_role: bool, by_podcast: bool) -> str:
+    """
+    The SQL behind :meth:`ParquetBackend.concordance`, built once per shape.
+
+    DuckDB only picks the candidate turns; the keyword is then found and
+    windowed by :func:`_kwic_rows`, the code the scan path uses. The filter
+    is a case-insensitive RE2 match rather than ILIKE: ILIKE compares
+    ``lower()`` of both sides, so Greek final sigma, the long s and the like
+    miss turns that ``re.IGNORECASE`` matches, while RE2's ``(?i)`` folds
+    through the same simple case-folding orbits Python's does. See
+    :func:`_concordance_pattern`.
+
+    Parameters bind in this order: the pattern, then speaker_role and
+    podcast_id as present, then the limit.
+    """
+    where_clauses = ["regexp_matches(x.turn_text, ?)"]
+    if by_role:
+        where_clauses.append("t.speaker_role = ?")
+    if by_podcast:
+        where_clauses.append("t.podcast_id = ?")
+    where_sql = " AND ".join(where_clauses)
+
+    # Driven from the text table, like search_turns' exact mode: the
+    # predicate is on the text, so matching first and picking the metadata
+    # up afterwards avoids scanning all 185M index rows.
+    return f"""
+        SELECT t.episode_id, t.podcast_id, x.turn_text, t.speaker_role,
+               t.speaker_name, t.start_time, t.end_time
+        FROM txt.turn_text x
+        JOIN turns t ON t.episode_id = x.episode_id
+                    AND t.turn_count = x.turn_count
+        WHERE {where_sql}
+        LIMIT ?
+    """
+
+
+def _concordance_pattern(word: str) -> str:
+    """The RE2 pattern :func:`_concordance_sql` filters on for ``word``."""
+    # re.escape only backslashes ASCII punctuation and whitespace, which RE2
+    # reads as literals too.
+    return "(?i)" + re.escape(word)
+
+
+def _kwic_rows(rows: List[Dict[str, Any]], word: str,
+               context_words: int) -> List[Dict[str, Any]]:
+    """
+    KWIC rows for matched turns, in Python; see :func:`_concordance_sql`.
+
+    Serves both paths: the rows DuckDB's ILIKE prefilter returns, and the
+    turns the Parquet-scan fallback already has in memory. The pattern is :func:`_word_pattern`'s, cached across calls; its first
+    match starts where the first case-insensitive occurrence does.
+    """
+    kwic_results = []
+    word_pattern = _word_pattern(word)
+    # Count how many words the keyword spans
+    kw_word_count = len(word.split())
+
+    for row_dict in rows:
+        text = row_dict["turn_text"]
+        match = word_pattern.search(text)
+        if not match:
+            continue
+
+        # Split into words preserving positions
+        words = text.split()
+        # Find the word index of the match. The tokens fully before the
+        # match give its index; only when the match starts inside a token
+        # (e.g. searching "ike" in "like") does that last partial token
+        # need discounting.
+        char_pos = match.start()
+        prefix = text[:char_pos]
+        word_idx = len(prefix.split())
+        if prefix and not prefix[-1].isspace():
+            word_idx -= 1
+        if word_idx < 0:
+            word_idx = 0
+
+        left_start = max(0, word_idx - context_words)
+        right_end = min(len(words), word_idx + kw_word_count + context_words)
+
+        kwic_results.append(
+            {
+                "left_context": " ".join(words[left_start:word_idx]),
+                "keyword": " ".join(words[word_idx:word_idx + kw_word_count]),
+                "right_context": " ".join(
+                    words[word_idx + kw_word_count:right_end]),
+                "episode_id": row_dict["episode_id"],
+                "podcast_id": row_dict["podcast_id"],
+                "speaker_role": row_dict["speaker_role"],
+                "speaker_name": row_dict["speaker_name"],
+                "start_time": row_dict["start_time"],
+                "end_time": row_dict["end_time"],
+            }
+        )
+
+    return kwic_results
+
+
+# Result columns of search_turns, in order. Both the SQL and the scan paths
+# produce exactly these.
+_SEARCH_TURNS_COLUMNS = (
+    "episode_id", "podcast_id", "turn_count", "turn_text", "start_time",
+    "end_time", "duration", "speaker_role", "speaker_name", "word_count",
+    "score",
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _word_pattern(word: str) -> "re.Pattern":
+    """
+    Case-insensitive pattern for every occurrence of *word*, overlaps included.
+
+    Used by :meth:`ParquetBackend.estimate_word_audio` and :func:`_kwic_rows`,
+    so a word looked up repeatedly is compiled once. The lookahead makes
+    each match zero-width, so ``finditer`` steps one character at a time the
+    way the old ``str.find(word, idx + 1)`` loop did and "aa" is found twice
+    in "aaa". Matching the original text rather than a lowercased copy also
+    keeps the offsets in the text's own coordinates.
+    """
+    return re.compile(f"(?={re.escape(word)})", re.IGNORECASE)
+
+
+def _rows_to_table(rows: List[Dict[str, Any]]):
+    """Row dicts from a scan as a table with the search_turns columns."""
+    return pa.table({c: [r[c] for r in rows] for c in _SEARCH_TURNS_COLUMNS})
+
+
+def _fetch_arrow_table(result):
+    """
+    A DuckDB result as a ``pyarrow.Table``.
+
+    ``fetch_arrow_table`` is the name from the supported floor (0.9) onward;
+    DuckDB 1.4 renamed it ``to_arrow_table`` and now warns on the old one.
+    """
+    fetch = getattr(result, "to_arrow_table", None)
+    if fetch is None:
+        fetch = result.fetch_arrow_table
+    return fetch()
+
+
+def _fetch_rows(result) -> List[Dict[str, Any]]:
+    """
+    A DuckDB result as row dicts, converted through Arrow.
+
+    ``fetchall()`` builds a Python tuple per row, which then had to be zipped
+    with the column names into a dict per row. ``Table.to_pylist()`` produces
+    the dicts in one C-level pass over DuckDB's columnar result.
+    """
+    return _fetch_arrow_table(result).to_pylist()
+
+
 class ParquetBackend:
     """
     Backend that reads from a partitioned Parquet layout produced by
@@ -113,6 +563,11 @@ class ParquetBackend:
         # _all_episode_records. Reflects the current restrict view, so
         # restrict_to_podcasts clears it.
         self._episode_records_cache: Optional[List[Dict[str, Any]]] = None
+        # get_statistics() result. It walks ten category columns of the full
+        # episode catalog value by value, which costs seconds against the
+        # whole corpus and was being redone for every call. Like the record
+        # cache it reflects the current restrict view.
+        self._statistics_cache: Optional[Dict[str, Any]] = None
         self._num_podcasts: int = 0
         self._num_episodes: int = 0
 
@@ -123,11 +578,18 @@ class ParquetBackend:
 
         # Lazy-loaded indexes for search / metrics
         self._speaker_index_df = None
+        # (index DataFrame, column arrays) for search_by_speaker_name; see
+        # _speaker_columns. Keyed on the DataFrame so replacing it rebuilds.
+        self._speaker_columns_cache = None
         self._host_index_df = None
         self._host_episode_index_df = None
         self._guest_index_df = None
         self._guest_episode_index_df = None
         self._episode_metrics_df = None
+        # (metrics DataFrame, column arrays); see _episode_metrics_columns.
+        self._episode_metrics_columns_cache = None
+        # (metrics DataFrame, episode_id -> row dict); see get_episode_metrics.
+        self._episode_metrics_lookup_cache = None
         self._search_db_con = None
         # Whether the optional turn-text database is attached alongside the
         # search index. Set when the search database is opened.
@@ -209,13 +671,20 @@ class ParquetBackend:
             )
         return path
 
-    def read_catalog(self, name: str, columns: Optional[List[str]] = None):
+    def read_catalog(self, name: str, columns: Optional[List[str]] = None, *,
+                     dictionary: Optional[List[str]] = None):
         """
         Read a metadata catalog as an Arrow table.
 
         Unlike the per-podcast trees, catalogs are single files and small -- the
         guest index is a megabyte -- so this reads the whole thing. Pass
-        *columns* to project.
+        *columns* to project, and *dictionary* to read those string columns
+        dictionary-encoded (they become categoricals in ``to_pandas()``).
+
+        Memory-mapped: pages are read straight from the OS page cache rather
+        than copied through a read buffer first, which matters for the few
+        catalogs that are not small: the speaker name index and episode
+        metrics carry a row per episode or more.
         """
         from . import schema
 
@@ -223,9 +692,11 @@ class ParquetBackend:
         cols = schema.validate_columns(canonical, columns)
         path = self.metadata_path(canonical)
         logger.info("Loading %s from %s", canonical, path)
-        return pq.read_table(path, columns=cols)
+        return pq.read_table(path, columns=cols, memory_map=True,
+                             read_dictionary=dictionary)
 
-    def _ensure_catalog_df(self, attr: str, name: str) -> None:
+    def _ensure_catalog_df(self, attr: str, name: str, *,
+                           dictionary: Optional[List[str]] = None) -> None:
         """
         Materialize a catalog into ``self.<attr>`` on first access.
 
@@ -236,7 +707,8 @@ class ParquetBackend:
         """
         if getattr(self, attr) is not None:
             return
-        setattr(self, attr, self.read_catalog(name).to_pandas())
+        setattr(self, attr,
+                self.read_catalog(name, dictionary=dictionary).to_pandas())
 
     # ------------------------------------------------------------------
     # Lazy DataFrame access
@@ -456,8 +928,8 @@ class ParquetBackend:
         # --- Load manifest ---
         manifest_path = os.path.join(self.data_dir, "manifest.json")
         if os.path.exists(manifest_path):
-            with open(manifest_path) as f:
-                self._manifest = json.load(f)
+            with open(manifest_path, "rb") as f:
+                self._manifest = _json_loads(f.read())
         else:
             self._manifest = {}
 
@@ -800,9 +1272,10 @@ class ParquetBackend:
         rather than walking the full catalog -- which, on a lazy source, would
         download the corpus.
         """
-        # The cached record list reflects a particular view of the catalog, so
-        # changing the restriction invalidates it.
+        # The cached record list and statistics reflect a particular view of
+        # the catalog, so changing the restriction invalidates them.
         self._episode_records_cache = None
+        self._statistics_cache = None
         if podcast_ids is None:
             self._restrict = None
             self._num_podcasts = len(self._pid_to_idx)
@@ -1195,7 +1668,14 @@ class ParquetBackend:
     # Statistics
     # ------------------------------------------------------------------
     def get_statistics(self) -> Dict[str, Any]:
-        """Compute dataset statistics from the in-memory catalogs."""
+        """
+        Compute dataset statistics from the in-memory catalogs.
+
+        Computed once per restrict view and cached; callers get a copy, so
+        editing the returned dict cannot corrupt later calls.
+        """
+        if self._statistics_cache is not None:
+            return copy.deepcopy(self._statistics_cache)
         self._ensure_podcast_df()
         self._ensure_episode_df()
         pc = self._podcast_df
@@ -1229,7 +1709,7 @@ class ParquetBackend:
         # Speaker distribution
         speaker_counts = ec["num_main_speakers"].value_counts().to_dict()
 
-        return {
+        self._statistics_cache = {
             "total_podcasts": total_podcasts,
             "total_episodes": total_episodes,
             "total_duration_hours": float(total_duration_hours),
@@ -1238,6 +1718,7 @@ class ParquetBackend:
             "language_distribution": {str(k): int(v) for k, v in language_counts.items()},
             "speaker_distribution": {int(k): int(v) for k, v in speaker_counts.items()},
         }
+        return copy.deepcopy(self._statistics_cache)
 
     # ------------------------------------------------------------------
     # DuckDB (optional)
@@ -1382,8 +1863,8 @@ class ParquetBackend:
                 return val
             if isinstance(val, str):
                 try:
-                    return json.loads(val)
-                except (json.JSONDecodeError, ValueError):
+                    return _json_loads(val)
+                except ValueError:
                     return {}
             return {}
 
@@ -1455,6 +1936,13 @@ class ParquetBackend:
             podcast_id, episode_id, include_audio=self.load_audio_features
         )
 
+        # Speaker labels, roles and names repeat on every turn of an episode --
+        # a handful of distinct values over hundreds or thousands of turns --
+        # and Arrow hands each row its own copy. Interning keeps one string per
+        # value, which is most of what these fields cost in memory, and lets
+        # comparisons and dict lookups on them short-circuit on identity.
+        intern = sys.intern
+
         turns = []
         for row in turn_rows:
             speaker = row.get("speaker", [])
@@ -1465,6 +1953,7 @@ class ParquetBackend:
                     speaker = list(speaker)
                 except (TypeError, ValueError):
                     speaker = [str(speaker)]
+            speaker = [intern(s) if isinstance(s, str) else s for s in speaker]
             # An empty speaker list is kept. Where diarization produced no
             # segments the transcript arrives as one unattributed turn, and
             # dropping it here would lose the text entirely rather than leave
@@ -1503,8 +1992,10 @@ class ParquetBackend:
                         "f0_semitone_from_27_5hz_sma3nz_stdev"
                     ),
                     f1_frequency_sma3nz_stdev=row.get("f1_frequency_sma3nz_stdev"),
-                    inferred_speaker_role=str(row.get("inferred_speaker_role", "")) or None,
-                    inferred_speaker_name=str(row.get("inferred_speaker_name", "")) or None,
+                    inferred_speaker_role=intern(
+                        str(row.get("inferred_speaker_role", ""))) or None,
+                    inferred_speaker_name=intern(
+                        str(row.get("inferred_speaker_name", ""))) or None,
                     # token_count since the rename; word_count is the
                     # same column under its old, misleading name in
                     # layouts built before it. Both mean aligned tokens
@@ -1531,8 +2022,66 @@ class ParquetBackend:
     # Lazy loaders for precomputed indexes
     # ------------------------------------------------------------------
     def _ensure_speaker_index(self) -> None:
-        """Load speaker_name_index.parquet on first speaker search."""
-        self._ensure_catalog_df("_speaker_index_df", "speaker_name_index")
+        """
+        Load speaker_name_index.parquet on first speaker search.
+
+        ``role`` takes three values and ``podcast_id`` repeats for every name in
+        every episode of a podcast, so both are read dictionary-encoded: an
+        int32 code per row instead of a string object, and ``role`` arrives
+        as a categorical whose codes :meth:`_speaker_columns` uses directly.
+        """
+        self._ensure_catalog_df("_speaker_index_df", "speaker_name_index",
+                                dictionary=["role", "podcast_id"])
+
+    def _speaker_columns(self) -> Dict[str, Any]:
+        """
+        The speaker name index as one array per column.
+
+        ``search_by_speaker_name`` used to run pandas ``str.contains`` over the
+        index for every query, which boxes each name as a Python str on each
+        call. Instead the distinct lowercased names are kept as an Arrow string
+        array -- packed end to end, not padded to the longest name as a NumPy
+        unicode array is -- each row keeps the int code of its name, and
+        ``role`` -- three distinct values over millions of rows -- is kept as
+        int8 codes. A query then tests each distinct name once, through Arrow
+        compute or :func:`_substring_mask`, and gathers the answer back onto
+        the rows through the codes. Built on first use and again whenever
+        ``_speaker_index_df`` is replaced.
+        """
+        import pyarrow.compute as pc
+
+        self._ensure_speaker_index()
+        df = self._speaker_index_df
+        cached = self._speaker_columns_cache
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        raw_names = pa.array(df["name_normalized"], type=pa.string(),
+                             from_pandas=True)
+        # An Arrow-backed string column (the pandas 3 default) converts to a
+        # ChunkedArray when it has more than one chunk, e.g. after pd.concat.
+        # One dictionary is needed for the codes, so encode a single array.
+        if isinstance(raw_names, pa.ChunkedArray):
+            raw_names = raw_names.combine_chunks()
+        names = pc.dictionary_encode(pc.utf8_lower(pc.fill_null(raw_names, "")))
+        # A null role has code -1 on both paths. The roles list ends in None,
+        # so roles[-1] reads it back as None rather than the last real role.
+        if df["role"].dtype == "category":
+            roles = df["role"].cat.categories.astype(str).tolist()
+            role_codes = df["role"].cat.codes.to_numpy()
+        else:
+            role_codes, uniques = df["role"].factorize()
+            roles = [str(r) for r in uniques]
+        cols = {
+            "names": names.dictionary,
+            "name_codes": names.indices.to_numpy(zero_copy_only=False),
+            "roles": roles + [None],
+            "role_codes": role_codes.reshape(-1).astype(np.int8),
+            "episode_id": df["episode_id"].to_numpy(dtype=object),
+            "podcast_id": df["podcast_id"].to_numpy(dtype=object),
+            "name_original": df["name_original"].to_numpy(dtype=object),
+        }
+        self._speaker_columns_cache = (df, cols)
+        return cols
 
     def _ensure_host_index(self) -> None:
         """Load host_index.parquet (podcast-grained hosts) on first use."""
@@ -1655,6 +2204,42 @@ class ParquetBackend:
         """Load episode_metrics.parquet on first metrics query."""
         self._ensure_catalog_df("_episode_metrics_df", "episode_metrics")
 
+    def _episode_metrics_columns(self) -> Dict[str, Any]:
+        """
+        The filterable episode_metrics columns as NumPy arrays.
+
+        Extracted once per metrics DataFrame, like :meth:`_speaker_columns`,
+        so :meth:`filter_episodes_by_metrics` compares contiguous arrays
+        instead of re-slicing a DataFrame once per bound.
+        """
+        self._ensure_episode_metrics_df()
+        df = self._episode_metrics_df
+        cached = self._episode_metrics_columns_cache
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        cols = {c: df[c].to_numpy() for _, c in _METRIC_FILTER_COLUMNS
+                if c in df.columns}
+        self._episode_metrics_columns_cache = (df, cols)
+        return cols
+
+    def _episode_metrics_id_order(self):
+        """
+        The metrics catalog's episode ids sorted, with the permutation back.
+
+        Built on the first :meth:`get_episode_metrics` miss and kept with the
+        column arrays, so it is rebuilt with them. The ids are 16-character
+        hashes, so a fixed-width unicode array is compact and sorts in C. The
+        sort is stable, so among duplicate ids the first row in catalog order
+        is found, as the row scan did.
+        """
+        cols = self._episode_metrics_columns()
+        if "_id_order" not in cols:
+            ids = self._episode_metrics_df["episode_id"].astype(str).to_numpy(
+                dtype=str)
+            order = np.argsort(ids, kind="stable")
+            cols["_id_order"] = (ids[order], order)
+        return cols["_id_order"]
+
     def has_search_db(self) -> bool:
         """Whether the DuckDB full-text index is available."""
         if self._search_db_con is not None:
@@ -1698,12 +2283,32 @@ class ParquetBackend:
             yield self._open_parquet(path).read_row_group(loc.row_group)
             return
 
+        paths = []
         for part in sm.parts("turns_text"):
             rel = sm.relpath("turns_text", part)
-            if not self._source.exists_locally(rel):
-                continue
-            yield self._open_parquet(
-                os.path.join(self._source.root, rel)).read()
+            if self._source.exists_locally(rel):
+                paths.append(os.path.join(self._source.root, rel))
+        if len(paths) <= 1 or _SCAN_READ_AHEAD < 1:
+            for path in paths:
+                yield self._open_parquet(path).read()
+            return
+
+        # Read ahead in part order. Handles are opened here, on the calling
+        # thread, so the handle cache is only ever touched from one thread;
+        # the pool only runs the reads.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=_SCAN_READ_AHEAD) as pool:
+            pending = deque(pool.submit(self._open_parquet(p).read)
+                            for p in paths[:_SCAN_READ_AHEAD])
+            queued = len(pending)
+            while pending:
+                table = pending.popleft().result()
+                if queued < len(paths):
+                    pending.append(
+                        pool.submit(self._open_parquet(paths[queued]).read))
+                    queued += 1
+                yield table
 
     def _scan_turns(
         self,
@@ -1737,7 +2342,7 @@ class ParquetBackend:
                 mask = pc.match_substring_regex(text, query)
                 scores = None
             elif mode == "exact":
-                mask = pc.match_substring(text, query, ignore_case=True)
+                mask = _substring_mask(text, query)
                 scores = None
             else:  # "fts": every term must appear; rank by term frequency
                 mask = None
@@ -1828,6 +2433,10 @@ class ParquetBackend:
         logger.info("Opening DuckDB search database at %s", path)
         con = duckdb.connect(path, read_only=True)
         con.execute("LOAD fts")
+        # threads and memory_limit stay at DuckDB's defaults. Its thread count
+        # respects a container's CPU quota, which os.cpu_count() does not, and
+        # a fixed memory figure would starve large machines and overcommit
+        # small ones.
 
         text_path = os.path.join(self._meta_dir, "turns_text.duckdb")
         self._has_text_db = os.path.exists(text_path)
@@ -1856,7 +2465,8 @@ class ParquetBackend:
         speaker_role: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+        as_table: bool = False,
+    ) -> Any:
         """
         Search turn text across the corpus.
 
@@ -1868,10 +2478,15 @@ class ParquetBackend:
             speaker_role: Filter by speaker role ("host", "guest", etc.).
             limit: Maximum results to return.
             offset: Number of results to skip.
+            as_table: Return a ``pyarrow.Table`` rather than a list of dicts.
+                For large ``limit`` values: the SQL path then hands over
+                DuckDB's columnar result as is, with no Python object built
+                per row or per value.
 
         Returns:
             List of dicts with episode_id, podcast_id, turn_count,
-            turn_text, start_time, end_time, speaker_role, score.
+            turn_text, start_time, end_time, speaker_role, score -- or a
+            table with those columns when *as_table* is set.
 
         Uses the DuckDB full-text index when present. Without it, falls back to
         scanning the turn partitions on disk, which is the intended path for a
@@ -1885,7 +2500,8 @@ class ParquetBackend:
                 query, mode=mode, podcast_id=podcast_id,
                 episode_id=episode_id, speaker_role=speaker_role,
             )
-            return rows[offset:offset + limit]
+            rows = rows[offset:offset + limit]
+            return _rows_to_table(rows) if as_table else rows
 
         self._ensure_search_db()
         con = self._search_db_con
@@ -1902,86 +2518,26 @@ class ParquetBackend:
                 query, mode=mode, podcast_id=podcast_id,
                 episode_id=episode_id, speaker_role=speaker_role,
             )
-            return rows[offset:offset + limit]
-
-        where_clauses = []
-        params = []
-
-        if podcast_id:
-            where_clauses.append("t.podcast_id = ?")
-            params.append(podcast_id)
-        if episode_id:
-            where_clauses.append("t.episode_id = ?")
-            params.append(episode_id)
-        if speaker_role:
-            where_clauses.append("t.speaker_role = ?")
-            params.append(speaker_role)
-
-        where_sql = ""
-        if where_clauses:
-            where_sql = "WHERE " + " AND ".join(where_clauses)
-
-        # Text comes from the attached database when it is there. Selecting it
-        # is what makes the difference between returning a snippet and returning
-        # a pointer, so the column list is built once and reused.
-        text_col = "x.turn_text" if self._has_text_db else "NULL AS turn_text"
-        text_join = ("JOIN txt.turn_text x USING (episode_id, turn_count)"
-                     if self._has_text_db else "")
+            rows = rows[offset:offset + limit]
+            return _rows_to_table(rows) if as_table else rows
+
+        if mode not in ("fts", "exact", "regex"):
+            raise ValueError(f"Invalid search mode: {mode!r}. Use 'fts', 'exact', or 'regex'.")
 
+        sql = _search_turns_sql(
+            mode, bool(podcast_id), bool(episode_id), bool(speaker_role),
+            self._has_text_db,
+        )
+        filters = [v for v in (podcast_id, episode_id, speaker_role) if v]
         if mode == "fts":
-            # Rank first, then attach text to the handful of rows that survive.
-            # Joining before the LIMIT joins all 185M scored rows to get twenty,
-            # which measured about 20 seconds of pure waste per query.
-            inner_where = " AND ".join(c.replace("t.", "") for c in where_clauses)
-            sql = f"""
-                WITH top AS (
-                    SELECT episode_id, podcast_id, turn_count, start_time,
-                           end_time, duration, speaker_role, speaker_name,
-                           word_count, score
-                    FROM (
-                        SELECT *, fts_main_turns.match_bm25(row_id, ?) AS score
-                        FROM turns
-                    )
-                    WHERE score IS NOT NULL
-                    {"AND " + inner_where if inner_where else ""}
-                    ORDER BY score DESC
-                    LIMIT ? OFFSET ?
-                )
-                SELECT top.episode_id, top.podcast_id, top.turn_count,
-                       {text_col}, top.start_time, top.end_time, top.duration,
-                       top.speaker_role, top.speaker_name, top.word_count,
-                       top.score
-                FROM top {text_join.replace("USING (episode_id, turn_count)",
-                                            "ON x.episode_id = top.episode_id "
-                                            "AND x.turn_count = top.turn_count")}
-                ORDER BY top.score DESC
-            """
-            result = con.execute(sql, [query, limit, offset] + params)
-        elif mode in ("exact", "regex"):
-            # Both match on the text, so they drive from the text table and pick
-            # the metadata up afterwards. Reaching this point means the text
-            # database is attached; without it these modes scanned Parquet above.
-            predicate = ("x.turn_text ILIKE ?" if mode == "exact"
-                         else "regexp_matches(x.turn_text, ?)")
-            pattern = f"%{query}%" if mode == "exact" else query
-            sql = f"""
-                SELECT t.episode_id, t.podcast_id, t.turn_count, x.turn_text,
-                       t.start_time, t.end_time, t.duration, t.speaker_role,
-                       t.speaker_name, t.word_count, 1.0 AS score
-                FROM txt.turn_text x
-                JOIN turns t ON t.episode_id = x.episode_id
-                            AND t.turn_count = x.turn_count
-                WHERE {predicate}
-                {"AND " + " AND ".join(where_clauses) if where_clauses else ""}
-                LIMIT ? OFFSET ?
-            """
-            result = con.execute(sql, [pattern] + params + [limit, offset])
+            result = con.execute(sql, [query, limit, offset] + filters)
         else:
-            raise ValueError(f"Invalid search mode: {mode!r}. Use 'fts', 'exact', or 'regex'.")
+            pattern = f"%{query}%" if mode == "exact" else query
+            result = con.execute(sql, [pattern] + filters + [limit, offset])
 
-        columns = [desc[0] for desc in result.description]
-        rows = result.fetchall()
-        return [dict(zip(columns, row)) for row in rows]
+        if as_table:
+            return _fetch_arrow_table(result)
+        return _fetch_rows(result)
 
     def search_episodes_by_text(
         self,
@@ -2002,9 +2558,16 @@ class ParquetBackend:
             List of dicts with episode_id, podcast_id, match_count, best_score.
 
         Falls back to scanning local partitions when the full-text index is
-        absent; see :meth:`search_turns`.
+        absent, and for "exact"/"regex" when the text database is; see
+        :meth:`search_turns`.
         """
-        if not self.has_search_db():
+        if mode not in ("fts", "exact", "regex"):
+            raise ValueError(f"Invalid search mode: {mode!r}.")
+        if self.has_search_db():
+            self._ensure_search_db()
+        # As in search_turns: "exact" and "regex" need the text database.
+        if not self.has_search_db() or (
+                mode != "fts" and not self._has_text_db):
             self._warn_scanning(len(self.local_turn_podcast_ids()))
             agg: Dict[tuple, Dict[str, Any]] = {}
             for r in self._scan_turns(query, mode=mode):
@@ -2023,55 +2586,49 @@ class ParquetBackend:
             out = sorted(agg.values(), key=lambda d: d["best_score"], reverse=True)
             return out[:limit]
 
-        self._ensure_search_db()
-        con = self._search_db_con
+        pattern = f"%{query}%" if mode == "exact" else query
+        result = self._search_db_con.execute(
+            _search_episodes_sql(mode), [pattern, limit])
+        return _fetch_rows(result)
 
-        if mode == "fts":
-            sql = """
-                WITH scored AS (
-                    SELECT *, fts_main_turns.match_bm25(row_id, ?) AS score
-                    FROM turns
-                    WHERE score IS NOT NULL
-                )
-                SELECT episode_id, podcast_id,
-                       COUNT(*) AS match_count,
-                       MAX(score) AS best_score
-                FROM scored
-                GROUP BY episode_id, podcast_id
-                ORDER BY best_score DESC
-                LIMIT ?
-            """
-            result = con.execute(sql, [query, limit])
-        elif mode == "exact":
-            sql = """
-                SELECT episode_id, podcast_id,
-                       COUNT(*) AS match_count,
-                       1.0 AS best_score
-                FROM turns
-                WHERE turn_text ILIKE ?
-                GROUP BY episode_id, podcast_id
-                ORDER BY match_count DESC
-                LIMIT ?
-            """
-            result = con.execute(sql, [f"%{query}%", limit])
-        elif mode == "regex":
-            sql = """
-                SELECT episode_id, podcast_id,
-                       COUNT(*) AS match_count,
-                       1.0 AS best_score
-                FROM turns
-                WHERE regexp_matches(turn_text, ?)
-                GROUP BY episode_id, podcast_id
-                ORDER BY match_count DESC
-                LIMIT ?
-            """
-            result = con.execute(sql, [query, limit])
-        else:
-            raise ValueError(f"Invalid search mode: {mode!r}.")
+    def search_episodes_by_text_batch(
+        self,
+        queries: Iterable[str],
+        *,
+        mode: str = "fts",
+        limit: int = 100,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        :meth:`search_episodes_by_text` for many queries at once.
 
-        columns = [desc[0] for desc in result.description]
-        rows = result.fetchall()
-        return [dict(zip(columns, row)) for row in rows]
+        Returns a dict mapping each distinct query to what
+        ``search_episodes_by_text(query, mode=mode, limit=limit)`` returns
+        for it, empty lists included.
+
+        "exact" mode without the index is where batching pays: every query is
+        a full read of the turn text, and here the batch shares a single read
+        (see ``_SEARCH_EPISODES_BATCH_SQL``). "fts" queries each go through the
+        index already, and DuckDB compiles a non-constant regex pattern once
+        per row, so those modes -- and the Parquet-scan fallback -- run the
+        queries one at a time.
+        """
+        if mode not in ("fts", "exact", "regex"):
+            raise ValueError(f"Invalid search mode: {mode!r}.")
+        queries = list(dict.fromkeys(queries))
+        if self.has_search_db():
+            self._ensure_search_db()
+        if (mode != "exact" or not queries or not self.has_search_db()
+                or not self._has_text_db):
+            return {q: self.search_episodes_by_text(q, mode=mode, limit=limit)
+                    for q in queries}
+
+        result = self._search_db_con.execute(
+            _SEARCH_EPISODES_BATCH_SQL,
+            [queries, [f"%{q}%" for q in queries], limit])
+        out: Dict[str, List[Dict[str, Any]]] = {q: [] for q in queries}
+        for row in _fetch_rows(result):
+            out[row.pop("query")].append(row)
+        return out
 
     # ------------------------------------------------------------------
     # Speaker name search
@@ -2122,8 +2679,7 @@ class ParquetBackend:
         Returns:
             List of dicts with episode_id, podcast_id, name_original, role.
         """
-        self._ensure_speaker_index()
-        df = self._speaker_index_df
+        cols = self._speaker_columns()
 
         if role and role.lower() == "guest":
             warnings.warn(
@@ -2136,20 +2692,34 @@ class ParquetBackend:
                 stacklevel=3,
             )
 
+        import pyarrow.compute as pc
+
         name_lower = name.lower().strip()
+        names = cols["names"]
 
         if exact:
-            mask = df["name_normalized"] == name_lower
+            hit = pc.equal(names, name_lower)
         else:
-            mask = df["name_normalized"].str.contains(name_lower, na=False)
+            hit = _substring_mask(names, name_lower)
+        mask = np.asarray(hit, dtype=bool)[cols["name_codes"]]
 
+        role_name = None
         if role:
-            mask = mask & (df["role"] == role.lower())
-
-        result = df[mask].head(limit)
-        return result[["episode_id", "podcast_id", "name_original", "role"]].to_dict(
-            orient="records"
-        )
+            role_name = role.lower()
+            if role_name not in cols["roles"]:
+                return []
+            mask &= cols["role_codes"] == cols["roles"].index(role_name)
+
+        roles = cols["roles"]
+        return [
+            {
+                "episode_id": cols["episode_id"][i],
+                "podcast_id": cols["podcast_id"][i],
+                "name_original": cols["name_original"][i],
+                "role": role_name or roles[cols["role_codes"][i]],
+            }
+            for i in np.flatnonzero(mask)[:limit]
+        ]
 
     # ------------------------------------------------------------------
     # Concordance / KWIC
@@ -2183,8 +2753,8 @@ class ParquetBackend:
         queryable; see :meth:`search_turns`.
 
         Note:
-            Substring matching cannot use the full-text index -- ``ILIKE`` has
-            to look at every row -- so an unfiltered call reads the whole
+            Substring matching cannot use the full-text index -- the pattern
+            has to be tested against every row -- so an unfiltered call reads the whole
             30 GB text database: about 110 seconds on the full corpus cold,
             considerably less once the file is in the page cache. Pass
             ``podcast_id`` to bound it.
@@ -2202,85 +2772,13 @@ class ParquetBackend:
                 word, mode="exact", podcast_id=podcast_id,
                 speaker_role=speaker_role,
             )[:limit]
-        else:
-            con = self._search_db_con
-
-            where_clauses = ["x.turn_text ILIKE ?"]
-            params = [f"%{word}%"]
-
-            if speaker_role:
-                where_clauses.append("t.speaker_role = ?")
-                params.append(speaker_role)
-            if podcast_id:
-                where_clauses.append("t.podcast_id = ?")
-                params.append(podcast_id)
-
-            where_sql = " AND ".join(where_clauses)
-
-            # Driven from the text table, like search_turns' exact mode: the
-            # predicate is on the text, so matching first and picking the
-            # metadata up afterwards avoids scanning all 185M index rows.
-            sql = f"""
-                SELECT t.episode_id, t.podcast_id, x.turn_text, t.speaker_role,
-                       t.speaker_name, t.start_time, t.end_time
-                FROM txt.turn_text x
-                JOIN turns t ON t.episode_id = x.episode_id
-                            AND t.turn_count = x.turn_count
-                WHERE {where_sql}
-                LIMIT ?
-            """
-            result = con.execute(sql, params + [limit])
-            columns = [desc[0] for desc in result.description]
-            row_dicts = [dict(zip(columns, row)) for row in result.fetchall()]
-
-        kwic_results = []
-        word_pattern = re.compile(re.escape(word), re.IGNORECASE)
-
-        for row_dict in row_dicts:
-            text = row_dict["turn_text"]
-            match = word_pattern.search(text)
-            if not match:
-                continue
-
-            # Split into words preserving positions
-            words = text.split()
-            # Find the word index of the match. The tokens fully before the
-            # match give its index; only when the match starts inside a token
-            # (e.g. searching "ike" in "like") does that last partial token
-            # need discounting.
-            char_pos = match.start()
-            prefix = text[:char_pos]
-            word_idx = len(prefix.split())
-            if prefix and not prefix[-1].isspace():
-                word_idx -= 1
-            if word_idx < 0:
-                word_idx = 0
-
-            # Count how many words the keyword spans
-            kw_word_count = len(word.split())
-
-            left_start = max(0, word_idx - context_words)
-            right_end = min(len(words), word_idx + kw_word_count + context_words)
-
-            left_ctx = " ".join(words[left_start:word_idx])
-            keyword = " ".join(words[word_idx : word_idx + kw_word_count])
-            right_ctx = " ".join(words[word_idx + kw_word_count : right_end])
-
-            kwic_results.append(
-                {
-                    "left_context": left_ctx,
-                    "keyword": keyword,
-                    "right_context": right_ctx,
-                    "episode_id": row_dict["episode_id"],
-                    "podcast_id": row_dict["podcast_id"],
-                    "speaker_role": row_dict["speaker_role"],
-                    "speaker_name": row_dict["speaker_name"],
-                    "start_time": row_dict["start_time"],
-                    "end_time": row_dict["end_time"],
-                }
-            )
+            return _kwic_rows(row_dicts, word, context_words)
 
-        return kwic_results
+        sql = _concordance_sql(bool(speaker_role), bool(podcast_id))
+        filters = [v for v in (speaker_role, podcast_id) if v]
+        result = self._search_db_con.execute(
+            sql, [_concordance_pattern(word)] + filters + [limit])
+        return _kwic_rows(_fetch_rows(result), word, context_words)
 
     # ------------------------------------------------------------------
     # Episode & Turn Metrics
@@ -2294,13 +2792,33 @@ class ParquetBackend:
 
         Returns:
             Dict of metrics or None if not found.
+
+        A miss in the bounded LRU (see ``_EPISODE_METRICS_CACHE_SIZE``) is a
+        binary search over the sorted episode ids rather than a scan of the
+        column. Answers, including misses, are kept in the LRU, which is
+        dropped whenever ``_episode_metrics_df`` is replaced. Callers get a
+        copy.
         """
         self._ensure_episode_metrics_df()
         df = self._episode_metrics_df
-        match = df[df["episode_id"] == episode_id]
-        if match.empty:
-            return None
-        return match.iloc[0].to_dict()
+        cached = self._episode_metrics_lookup_cache
+        if cached is None or cached[0] is not df:
+            cached = self._episode_metrics_lookup_cache = (df, OrderedDict())
+        lookup = cached[1]
+        if episode_id in lookup:
+            lookup.move_to_end(episode_id)
+            row = lookup[episode_id]
+            return None if row is None else dict(row)
+
+        sorted_ids, order = self._episode_metrics_id_order()
+        i = int(np.searchsorted(sorted_ids, str(episode_id)))
+        row = None
+        if i < len(sorted_ids) and sorted_ids[i] == episode_id:
+            row = df.iloc[int(order[i])].to_dict()
+        lookup[episode_id] = row
+        while len(lookup) > _EPISODE_METRICS_CACHE_SIZE:
+            lookup.popitem(last=False)
+        return None if row is None else dict(row)
 
     def filter_episodes_by_metrics(
         self,
@@ -2333,36 +2851,45 @@ class ParquetBackend:
 
         Returns:
             List of episode metric dicts.
-        """
-        self._ensure_episode_metrics_df()
-        df = self._episode_metrics_df
 
-        if min_word_count is not None:
-            df = df[df["total_word_count"] >= min_word_count]
-        if max_word_count is not None:
-            df = df[df["total_word_count"] <= max_word_count]
-        if min_turn_count is not None:
-            df = df[df["total_turn_count"] >= min_turn_count]
-        if max_turn_count is not None:
-            df = df[df["total_turn_count"] <= max_turn_count]
-        if min_speaking_rate is not None:
-            df = df[df["avg_words_per_second"] >= min_speaking_rate]
-        if max_speaking_rate is not None:
-            df = df[df["avg_words_per_second"] <= max_speaking_rate]
-        if min_discourse_marker_rate is not None:
-            df = df[df["discourse_marker_rate"] >= min_discourse_marker_rate]
-        if max_discourse_marker_rate is not None:
-            df = df[df["discourse_marker_rate"] <= max_discourse_marker_rate]
-        if min_host_proportion is not None:
-            df = df[df["host_word_proportion"] >= min_host_proportion]
-        if max_host_proportion is not None:
-            df = df[df["host_word_proportion"] <= max_host_proportion]
-        if min_avg_gap is not None:
-            df = df[df["avg_gap_duration"] >= min_avg_gap]
-        if max_avg_gap is not None:
-            df = df[df["avg_gap_duration"] <= max_avg_gap]
-
-        return df.head(limit).to_dict(orient="records")
+        The metrics catalog is loaded on the first call and every call after
+        that filters the loaded columns, so results come back in catalog order
+        and the same call always returns the same rows.
+        """
+        bounds = {
+            "word_count": (min_word_count, max_word_count),
+            "turn_count": (min_turn_count, max_turn_count),
+            "speaking_rate": (min_speaking_rate, max_speaking_rate),
+            "discourse_marker_rate": (min_discourse_marker_rate,
+                                      max_discourse_marker_rate),
+            "host_proportion": (min_host_proportion, max_host_proportion),
+            "avg_gap": (min_avg_gap, max_avg_gap),
+        }
+        shape, values = [], []
+        for stem, column in _METRIC_FILTER_COLUMNS:
+            lo, hi = bounds[stem]
+            if lo is not None:
+                shape.append((column, ">="))
+                values.append(lo)
+            if hi is not None:
+                shape.append((column, "<="))
+                values.append(hi)
+
+        cols = self._episode_metrics_columns()
+        df = self._episode_metrics_df
+        if not shape:
+            return df.head(limit).to_dict(orient="records")
+        # Two buffers however many bounds there are: each comparison writes
+        # into the scratch array and is ANDed into the mask in place, rather
+        # than holding a fresh boolean array per bound until the end.
+        mask = np.ones(len(df), dtype=bool)
+        scratch = np.empty(len(df), dtype=bool)
+        for (column, op), value in zip(shape, values):
+            compare = np.greater_equal if op == ">=" else np.less_equal
+            compare(cols[column], value, out=scratch)
+            mask &= scratch
+        idx = np.flatnonzero(mask)[:limit]
+        return df.take(idx).to_dict(orient="records")
 
     def get_turn_metrics(
         self, podcast_id: str, episode_id: str
@@ -2376,6 +2903,10 @@ class ParquetBackend:
 
         Returns:
             List of turn metric dicts sorted by turn_count.
+
+        Reads only this podcast's row group of the ``turns_metrics`` tree, which
+        the shard map locates, so the episode filter runs over one podcast's
+        rows rather than a whole part file.
         """
         table = self._read_tree("turns_metrics", podcast_id)
         if table is None:
@@ -2387,18 +2918,17 @@ class ParquetBackend:
 
         import pyarrow.compute as pc
 
-        mask = pc.equal(table.column("episode_id"), episode_id)
-        table = table.filter(mask)
-
-        if table.num_rows == 0:
+        # Filter and sort as indices, then gather once: filtering the table and
+        # then taking the sorted order would copy every column twice. Arrow's
+        # sort is stable, so equal turn_counts keep their file order as before.
+        rows = pc.indices_nonzero(
+            pc.equal(table.column("episode_id"), episode_id))
+        if len(rows) == 0:
             return []
-
-        sort_indices = pc.sort_indices(table, sort_keys=[("turn_count", "ascending")])
-        table = table.take(sort_indices)
-
-        cols = table.to_pydict()
-        n = table.num_rows
-        return [{k: cols[k][i] for k in cols} for i in range(n)]
+        order = pc.sort_indices(table.column("turn_count").take(rows))
+        # One C-level conversion to row dicts, rather than a Python dict
+        # comprehension indexing every column list once per row.
+        return table.take(rows.take(order)).to_pylist()
 
     # ------------------------------------------------------------------
     # Audio word estimation
@@ -2454,51 +2984,44 @@ class ParquetBackend:
         erow = self.get_episode_by_id(episode_id) or {}
         episode_mp3_url = str(erow.get("mp3_url", "")) or ""
 
-        word_lower = word.lower()
-        found_count = 0
+        pattern = _word_pattern(word)
+        skip = occurrence
 
         for turn in turns:
             text = str(turn.get("turn_text", ""))
-            text_lower = text.lower()
-
-            # Find all occurrences of the word in this turn
-            start_search = 0
-            while True:
-                idx = text_lower.find(word_lower, start_search)
-                if idx == -1:
-                    break
-
-                if found_count == occurrence:
-                    # Estimate timing based on character position
-                    turn_start = float(turn.get("start_time", 0))
-                    turn_end = float(turn.get("end_time", 0))
-                    turn_duration = turn_end - turn_start
-
-                    if turn_duration <= 0 or len(text) == 0:
-                        return None
-
-                    # Linear interpolation based on character offset
-                    char_ratio_start = idx / len(text)
-                    char_ratio_end = (idx + len(word)) / len(text)
-
-                    est_start = turn_start + char_ratio_start * turn_duration
-                    est_end = turn_start + char_ratio_end * turn_duration
-
-                    # Confidence: lower for longer turns (less precise)
-                    confidence = min(1.0, 10.0 / max(turn_duration, 1.0))
-
-                    return {
-                        "mp3_url": turn.get("mp3_url") or episode_mp3_url,
-                        "estimated_start": round(est_start, 2),
-                        "estimated_end": round(est_end, 2),
-                        "turn_start": turn_start,
-                        "turn_end": turn_end,
-                        "turn_text": text,
-                        "confidence": round(confidence, 3),
-                    }
-
-                found_count += 1
-                start_search = idx + 1
+            for match in pattern.finditer(text):
+                if skip:
+                    skip -= 1
+                    continue
+
+                # Estimate timing based on character position
+                turn_start = float(turn.get("start_time", 0))
+                turn_end = float(turn.get("end_time", 0))
+                turn_duration = turn_end - turn_start
+
+                if turn_duration <= 0 or len(text) == 0:
+                    return None
+
+                # Linear interpolation based on character offset
+                idx = match.start()
+                char_ratio_start = idx / len(text)
+                char_ratio_end = (idx + len(word)) / len(text)
+
+                est_start = turn_start + char_ratio_start * turn_duration
+                est_end = turn_start + char_ratio_end * turn_duration
+
+                # Confidence: lower for longer turns (less precise)
+                confidence = min(1.0, 10.0 / max(turn_duration, 1.0))
+
+                return {
+                    "mp3_url": turn.get("mp3_url") or episode_mp3_url,
+                    "estimated_start": round(est_start, 2),
+                    "estimated_end": round(est_end, 2),
+                    "turn_start": turn_start,
+                    "turn_end": turn_end,
+                    "turn_text": text,
+                    "confidence": round(confidence, 3),
+                }
 
         return None
 
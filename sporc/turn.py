@@ -3,13 +3,19 @@ Turn class for representing conversation turns in podcast episodes.
 """
 
 import math
+import sys
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
 from .constants import PLACEHOLDER_SPEAKERS
 
+# A loaded corpus slice holds millions of turns, so they drop the per-instance
+# __dict__ where the interpreter allows it. dataclass(slots=True) is new in
+# 3.10; on 3.9 turns keep the ordinary layout and behave the same.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Turn:
     """
     Represents a single conversation turn in a podcast episode.
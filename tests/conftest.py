@@ -473,6 +473,11 @@ def mock_duckdb_result():
         result = MagicMock()
         result.description = [(col,) for col in columns]
         result.fetchall.return_value = rows
+        # The backend reads results through Arrow; see _fetch_arrow_table.
+        table = pa.table({col: list(vals) for col, vals in
+                          zip(columns, zip(*rows) if rows else [()] * len(columns))})
+        result.to_arrow_table.return_value = table
+        result.fetch_arrow_table.return_value = table
         return result
 
     return _make
@@ -488,6 +493,44 @@ def mock_duckdb_connection(mock_duckdb_result):
     return con
 
 
+@pytest.fixture
+def real_search_db():
+    """
+    Factory for an in-memory DuckDB laid out like the real search database pair.
+
+    ``turns`` holds the index columns and ``txt.turn_text`` the text, as in
+    turns_search.duckdb with turns_text.duckdb attached. Both are loaded from
+    Arrow tables. Pass turn dicts carrying ``turn_text`` and any index columns
+    that should differ from the defaults; ``turn_count`` defaults to the
+    position. The connection comes back wrapped in a MagicMock so the SQL
+    really runs while tests can still inspect what was sent -- a canned
+    result accepts SQL that a real database would reject.
+    """
+    duckdb = pytest.importorskip("duckdb")
+    index_cols = ("episode_id", "podcast_id", "turn_count", "speaker_role",
+                  "speaker_name", "start_time", "end_time")
+    defaults = {"episode_id": "ep1", "podcast_id": "pod1",
+                "speaker_role": "host", "speaker_name": "John",
+                "start_time": 0.0, "end_time": 10.0}
+
+    def _make(turns):
+        rows = [{**defaults, "turn_count": i, **t} for i, t in enumerate(turns)]
+        index = pa.table({c: [r[c] for r in rows] for c in index_cols})
+        text = pa.table({c: [r[c] for r in rows]
+                         for c in ("episode_id", "turn_count", "turn_text")})
+        real = duckdb.connect()
+        real.execute("ATTACH ':memory:' AS txt")
+        real.register("index_rows", index)
+        real.register("text_rows", text)
+        real.execute("CREATE TABLE turns AS SELECT * FROM index_rows")
+        real.execute("CREATE TABLE txt.turn_text AS SELECT * FROM text_rows")
+        real.unregister("index_rows")
+        real.unregister("text_rows")
+        return MagicMock(wraps=real)
+
+    return _make
+
+
 @pytest.fixture
 def mock_parquet_backend(sample_speaker_index_df, sample_episode_metrics_df):
     """ParquetBackend with skipped __init__ and pre-set internal state."""
@@ -496,15 +539,19 @@ def mock_parquet_backend(sample_speaker_index_df, sample_episode_metrics_df):
     backend._meta_dir = "/fake/data/metadata"
     backend._source = LocalDataSource("/fake/data")
     backend._speaker_index_df = None
+    backend._speaker_columns_cache = None
     backend._host_index_df = None
     backend._host_episode_index_df = None
     backend._guest_index_df = None
     backend._guest_episode_index_df = None
     backend._episode_metrics_df = None
+    backend._episode_metrics_columns_cache = None
+    backend._episode_metrics_lookup_cache = None
     backend._search_db_con = None
     backend._podcast_df = None
     backend._episode_df = None
     backend._episode_records_cache = None
+    backend._statistics_cache = None
     backend._num_podcasts = 0
     backend._num_episodes = 0
     backend._restrict = None
@@ -0,0 +1,94 @@
+"""
+Tests for convert_to_parquet.py record readers.
+"""
+
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+# scripts/ is not a package, so add it to sys.path
+_scripts_dir = os.path.join(os.path.dirname(__file__), "..", "scripts")
+sys.path.insert(0, os.path.abspath(_scripts_dir))
+
+from convert_to_parquet import (
+    TURN_SOURCE_SCHEMA, stream_jsonl_gz, stream_jsonl_gz_columns,
+)
+
+
+def _write(path, lines):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+    return str(path)
+
+
+def _turn(i, **extra):
+    rec = {"mp3url": f"http://x/{i}.mp3", "speaker": ["SPEAKER_00"],
+           "turnText": f"turn {i}", "startTime": i, "turnCount": i,
+           "unusedField": {"nested": i}}
+    rec.update(extra)
+    return json.dumps(rec)
+
+
+class TestStreamJsonlGzColumns:
+    """The Arrow reader must yield what the line-by-line reader would."""
+
+    def test_reads_only_the_schema_fields(self, tmp_path):
+        path = _write(tmp_path / "t.jsonl.gz", [_turn(i) for i in range(3)])
+        records = list(stream_jsonl_gz_columns(path, TURN_SOURCE_SCHEMA))
+        assert [r["turnText"] for r in records] == ["turn 0", "turn 1", "turn 2"]
+        assert set(records[0]) == set(TURN_SOURCE_SCHEMA.names)
+        assert records[1]["startTime"] == 1.0
+        assert records[0]["inferredSpeakerRole"] is None
+
+    @pytest.mark.parametrize("bad", ["{not json", _turn(99, speaker="SPEAKER_01")])
+    def test_falls_back_without_losing_or_repeating_records(self, tmp_path, bad):
+        lines = [_turn(0), _turn(1), bad, _turn(2)]
+        path = _write(tmp_path / "t.jsonl.gz", lines)
+        texts = [r["turnText"] for r in
+                 stream_jsonl_gz_columns(path, TURN_SOURCE_SCHEMA)]
+        assert texts == [r["turnText"] for r in stream_jsonl_gz(path)]
+
+    @pytest.mark.parametrize("bad", ["{not json", _turn(99, speaker="SPEAKER_01")])
+    def test_resumes_after_the_blocks_already_yielded(self, tmp_path, caplog, bad):
+        """
+        With the bad line past the first block, Arrow has already yielded
+        records when it fails, and the line-by-line reader must pick up after
+        exactly those: no record twice, none skipped.
+        """
+        lines = [_turn(i) for i in range(40)]
+        lines.insert(25, bad)
+        path = _write(tmp_path / "t.jsonl.gz", lines)
+        with caplog.at_level("WARNING"):
+            got = [(r["turnText"], r["turnCount"]) for r in
+                   stream_jsonl_gz_columns(path, TURN_SOURCE_SCHEMA,
+                                           block_size=1024)]
+        expected = [(r["turnText"], r["turnCount"]) for r in stream_jsonl_gz(path)]
+        assert got == expected
+        # The fallback started part-way through, so the resume path ran
+        resumed = [rec for rec in caplog.records
+                   if "line by line" in rec.getMessage()]
+        assert len(resumed) == 1
+        assert not resumed[0].getMessage().endswith("from record 0")
+
+    def test_rows_keep_their_types_across_the_fallback(self, tmp_path):
+        lines = [_turn(i) for i in range(40)]
+        lines.insert(25, "{not json")
+        # Past the bad line, so only the line-by-line reader sees these
+        lines.append(_turn(40, turnCount=41.0, endTime=7))
+        lines.append(json.dumps({"mp3url": "http://x/42.mp3"}))
+        path = _write(tmp_path / "t.jsonl.gz", lines)
+        records = list(stream_jsonl_gz_columns(path, TURN_SOURCE_SCHEMA,
+                                               block_size=1024))
+        assert len(records) == 42
+        assert all(list(r) == TURN_SOURCE_SCHEMA.names for r in records)
+        first, after, sparse = records[0], records[-2], records[-1]
+        for name in TURN_SOURCE_SCHEMA.names:
+            if first[name] is not None and after[name] is not None:
+                assert type(first[name]) is type(after[name]), name
+        assert after["turnCount"] == 41 and after["endTime"] == 7.0
+        assert sparse["turnText"] is None and sparse["speaker"] is None
+
@@ -158,7 +158,7 @@ class TestWrapperDelegation:
         ds._parquet_backend.search_turns.assert_called_once_with(
             "hello", mode="exact", podcast_id="p1",
             episode_id="e1", speaker_role="host",
-            limit=50, offset=10,
+            limit=50, offset=10, as_table=False,
         )
 
     def test_search_episodes_by_text_delegates(self):
@@ -168,6 +168,13 @@ class TestWrapperDelegation:
             "query", mode="regex", limit=25,
         )
 
+    def test_search_episodes_by_text_batch_delegates(self):
+        ds = _make_dataset()
+        ds.search_episodes_by_text_batch(["a", "b"], mode="exact", limit=5)
+        ds._parquet_backend.search_episodes_by_text_batch.assert_called_once_with(
+            ["a", "b"], mode="exact", limit=5,
+        )
+
     def test_search_by_speaker_name_delegates(self):
         ds = _make_dataset()
         ds.search_by_speaker_name("John", role="host", exact=True, limit=10)
@@ -165,3 +165,74 @@ def test_episode_error_cases(sample_episode):
         len(sample_episode)
     with pytest.raises(RuntimeError):
         sample_episode.get_turn_statistics()
+
+def test_turn_statistics_follow_changes_to_turns(sample_episode):
+    # The numeric columns behind the statistics are cached, and _turns is both
+    # reassigned and appended to in place; neither may leave them stale.
+    _load_turns(sample_episode, _make_turns())
+    stats = sample_episode.get_turn_statistics()
+    assert stats['total_turns'] == 3
+    assert stats['total_words'] == 6
+    assert stats['avg_turn_duration'] == 5.0
+    assert stats['speaker_distribution'] == {"SPEAKER_00": 2, "SPEAKER_01": 1}
+    assert stats['role_distribution'] == {"unknown": 1, "guest": 1, "host": 1}
+
+    sample_episode._turns.append(Turn(
+        speaker=["SPEAKER_01"], text="one two three four", start_time=15.0,
+        end_time=25.0, duration=10.0, turn_count=4))
+    stats = sample_episode.get_turn_statistics()
+    assert (stats['total_turns'], stats['total_words']) == (4, 10)
+
+    _load_turns(sample_episode, _make_turns()[:1])
+    stats = sample_episode.get_turn_statistics()
+    assert (stats['total_turns'], stats['total_words']) == (1, 2)
+
+def test_get_turns_by_min_length_keeps_episode_order(sample_episode):
+    turns = _make_turns()
+    turns[0].text = "a much longer opening turn"
+    _load_turns(sample_episode, turns)
+    assert sample_episode.get_turns_by_min_length(2) == sample_episode.turns
+    assert sample_episode.get_turns_by_min_length(3) == [sample_episode.turns[0]]
+    assert sample_episode.get_turns_by_min_length(0) == sample_episode.turns
+
+def test_to_dict_reflects_turns_as_they_load(sample_episode):
+    before = sample_episode.to_dict()
+    assert (before['turns_loaded'], before['num_turns']) == (False, 0)
+    before['host_names'].append("Mallory")          # callers get a copy
+    assert sample_episode.host_names == ["Bob"]
+
+    _load_turns(sample_episode, _make_turns())
+    after = sample_episode.to_dict()
+    assert (after['turns_loaded'], after['num_turns']) == (True, 3)
+    assert after == sample_episode.to_dict()
+
+def test_trimming_clips_only_the_partial_turns(sample_episode):
+    _load_turns(sample_episode, _make_turns())
+    result = sample_episode.get_turns_by_time_range_with_trimming(2, 12)
+    assert [(d['trimmed_start'], d['trimmed_end'], d['was_trimmed'])
+            for d in result] == [(2, 5.0, True), (5.0, 10.0, False), (10.0, 12, True)]
+    full = sample_episode.get_turns_by_time_range_with_trimming(
+        2, 12, TimeRangeBehavior.INCLUDE_FULL_TURNS)
+    assert not any(d['was_trimmed'] for d in full)
+    assert full[0]['trimmed_start'] == 0.0
+
+def test_to_dict_reflects_field_edits(sample_episode):
+    sample_episode.to_dict()
+    sample_episode.title = "Renamed"
+    assert sample_episode.to_dict()['title'] == "Renamed"
+
+    sample_episode.category2 = "Science"
+    d = sample_episode.to_dict()
+    assert d['categories'] == sample_episode.categories
+
+    sample_episode.episode_date_localized = 0
+    assert sample_episode.to_dict()['episode_date'] == \
+        sample_episode.episode_date.isoformat()
+
+def test_to_dict_counts_agree_after_names_are_edited(sample_episode):
+    sample_episode.to_dict()
+    sample_episode.host_predicted_names.append("Carol")
+    d = sample_episode.to_dict()
+    assert d['host_names'] == sample_episode.host_names
+    assert d['num_hosts'] == len(d['host_names'])
+    assert d['is_panel'] == sample_episode.is_panel
@@ -62,6 +62,7 @@ class TestEnsureEpisodeMetricsDf:
              patch("sporc.parquet_backend.pq.read_table", return_value=mock_table) as mock_read:
             mock_parquet_backend._ensure_episode_metrics_df()
             mock_read.assert_called_once()
+            assert mock_read.call_args.kwargs["memory_map"] is True
             assert mock_parquet_backend._episode_metrics_df is mock_df
 
 
@@ -116,9 +117,22 @@ class TestEnsureSearchDb:
              patch("sporc.parquet_backend.os.path.exists", side_effect=exists):
             mock_parquet_backend._ensure_search_db()
             executed = [c[0][0] for c in mock_con.execute.call_args_list]
-            assert executed == ["LOAD fts"]
+            assert executed[0] == "LOAD fts"
+            assert not any("ATTACH" in s for s in executed)
             assert mock_parquet_backend._has_text_db is False
 
+    def test_connection_keeps_duckdb_defaults(self, mock_parquet_backend):
+        """DuckDB sizes its thread pool to the CPU quota; do not override it."""
+        mock_con = MagicMock()
+        mock_duckdb = MagicMock()
+        mock_duckdb.connect.return_value = mock_con
+        with patch.dict("sys.modules", {"duckdb": mock_duckdb}), \
+             patch("sporc.parquet_backend.os.path.exists", return_value=True):
+            mock_parquet_backend._ensure_search_db()
+        assert mock_duckdb.connect.call_args.kwargs == {"read_only": True}
+        executed = [c[0][0] for c in mock_con.execute.call_args_list]
+        assert not any("PRAGMA" in s for s in executed)
+
 
 # ===================================================================
 # search_turns
@@ -202,6 +216,104 @@ class TestSearchTurns:
         assert 100 in params
         assert 0 in params
 
+    def test_as_table_hands_over_the_arrow_result(self, mock_parquet_backend, mock_duckdb_result):
+        con = self._setup_backend(mock_parquet_backend, mock_duckdb_result)
+        result = con.execute.return_value
+        table = mock_parquet_backend.search_turns("hello", as_table=True)
+        assert table is result.to_arrow_table.return_value
+        result.fetchall.assert_not_called()
+
+    def test_same_shape_reuses_the_statement(self, mock_parquet_backend, mock_duckdb_result):
+        con = self._setup_backend(mock_parquet_backend, mock_duckdb_result)
+        mock_parquet_backend.search_turns("hello", mode="exact", podcast_id="pod1")
+        first = con.execute.call_args[0][0]
+        mock_parquet_backend.search_turns("other", mode="exact", podcast_id="pod2")
+        assert con.execute.call_args[0][0] is first
+        assert con.execute.call_args[0][1] == ["%other%", "pod2", 100, 0]
+
+
+class TestLocalTurnTables:
+    """Whole-part reads for the unindexed scan."""
+
+    def test_parts_are_read_ahead_and_yielded_in_order(
+        self, mock_parquet_backend, tmp_path
+    ):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from sporc.source import LocalDataSource
+
+        # More parts than the read-ahead, so it has to refill, plus one part
+        # that is not on disk and must be skipped.
+        names = [f"part-{i}.parquet" for i in range(7)]
+        (tmp_path / "turns").mkdir()
+        for i, name in enumerate(names[:-1]):
+            pq.write_table(pa.table({"n": [i]}), str(tmp_path / "turns" / name))
+
+        sm = MagicMock()
+        sm.parts.return_value = names
+        sm.relpath.side_effect = lambda tree, part: f"turns/{part}"
+        mock_parquet_backend._shard_map = sm
+        mock_parquet_backend._source = LocalDataSource(str(tmp_path))
+
+        tables = list(mock_parquet_backend._local_turn_tables())
+        assert [t.column("n")[0].as_py() for t in tables] == list(range(6))
+        # Opened through _open_parquet, like the single-part branch
+        assert set(mock_parquet_backend._parquet_file_cache) == {
+            str(tmp_path / "turns" / name) for name in names[:-1]}
+
+
+class TestJsonLoads:
+    """_json_loads must accept whatever json.loads accepts."""
+
+    @pytest.mark.parametrize("text", [
+        '{"a": NaN, "b": Infinity}',
+        '{"big": 123456789012345678901234567890}',
+        '[-9999999999999999999, 9223372036854775807]',
+        '{"speaker": "HOST"}',
+    ])
+    def test_matches_stdlib(self, text):
+        import json
+        import math
+        from sporc.parquet_backend import _json_loads
+
+        expected = json.loads(text)
+        pairs = list(expected.items() if isinstance(expected, dict) else enumerate(expected))
+        for data in (text, text.encode()):
+            got = _json_loads(data)
+            assert len(got) == len(expected)
+            for key, value in pairs:
+                if isinstance(value, float) and math.isnan(value):
+                    assert math.isnan(got[key])
+                else:
+                    assert got[key] == value and type(got[key]) is type(value)
+
+    def test_malformed_raises_value_error(self):
+        from sporc.parquet_backend import _json_loads
+
+        with pytest.raises(ValueError):
+            _json_loads(b"{not json")
+
+
+class TestSubstringMask:
+    """_substring_mask must agree with Arrow whether or not hyperscan is used."""
+
+    @pytest.mark.parametrize("query", ["ab", "a b", "ks", "été", "hello world", "a.b"])
+    def test_matches_arrow(self, query):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from sporc.parquet_backend import _substring_mask
+
+        # "xa" then "b": packed end to end the buffer reads "xab", a hit that
+        # belongs to neither row. "Kſ" folds to "ks" under Unicode rules.
+        rows = ["xa", "b", None, "", "Hello World", "Kſ", "ÉTÉ", "a b ab", "a.b"]
+        # Sliced, so the column's offsets do not start at zero.
+        arr = pa.array(["pad"] + rows).slice(1)
+        text = pa.chunked_array([arr, arr.slice(3)])
+        expected = [bool(v) for v in pc.match_substring(
+            text, query, ignore_case=True).to_pylist()]
+        got = [bool(v) for v in _substring_mask(text, query).to_pylist()]
+        assert got == expected
+
 
 # ===================================================================
 # search_episodes_by_text
@@ -212,6 +324,7 @@ class TestSearchEpisodesByText:
     """Tests for search_episodes_by_text method."""
 
     def _setup_backend(self, mock_parquet_backend, mock_duckdb_result):
+        mock_parquet_backend._has_text_db = True
         columns = ["episode_id", "podcast_id", "match_count", "best_score"]
         rows = [("ep1", "pod1", 5, 2.1)]
         result = mock_duckdb_result(columns, rows)
@@ -226,6 +339,14 @@ class TestSearchEpisodesByText:
         assert len(results) == 1
         assert results[0]["match_count"] == 5
 
+    def test_fts_mode_ranks_with_the_index(self, mock_parquet_backend, mock_duckdb_result):
+        con = self._setup_backend(mock_parquet_backend, mock_duckdb_result)
+        mock_parquet_backend.search_episodes_by_text("podcast", limit=7)
+        sql, params = con.execute.call_args[0]
+        assert "fts_main_turns.match_bm25" in sql
+        assert "regexp" not in sql and "ILIKE" not in sql
+        assert params == ["podcast", 7]
+
     def test_exact_mode(self, mock_parquet_backend, mock_duckdb_result):
         con = self._setup_backend(mock_parquet_backend, mock_duckdb_result)
         mock_parquet_backend.search_episodes_by_text("podcast", mode="exact")
@@ -249,6 +370,102 @@ class TestSearchEpisodesByText:
         params = con.execute.call_args[0][1]
         assert 50 in params
 
+    def test_sql_is_reused_across_calls(self, mock_parquet_backend, mock_duckdb_result):
+        con = self._setup_backend(mock_parquet_backend, mock_duckdb_result)
+        mock_parquet_backend.search_episodes_by_text("a", mode="exact")
+        mock_parquet_backend.search_episodes_by_text("b", mode="exact")
+        first, second = (c[0][0] for c in con.execute.call_args_list)
+        assert first is second
+
+    @pytest.mark.parametrize("mode,query", [("exact", "Hello"), ("regex", "h.llo")])
+    def test_text_modes_against_a_real_database(
+        self, mock_parquet_backend, real_search_db, mode, query
+    ):
+        mock_parquet_backend._has_text_db = True
+        mock_parquet_backend._search_db_con = real_search_db([
+            {"turn_text": "hello there"},
+            {"turn_text": "and hello again"},
+            {"turn_text": "goodbye", "episode_id": "ep2"},
+            {"turn_text": "hello", "episode_id": "ep3", "podcast_id": "pod2"},
+        ])
+        results = mock_parquet_backend.search_episodes_by_text(query, mode=mode)
+        assert results == [
+            {"episode_id": "ep1", "podcast_id": "pod1",
+             "match_count": 2, "best_score": 1.0},
+            {"episode_id": "ep3", "podcast_id": "pod2",
+             "match_count": 1, "best_score": 1.0},
+        ]
+
+    def test_exact_without_text_db_scans(self, mock_parquet_backend, mock_duckdb_result):
+        con = self._setup_backend(mock_parquet_backend, mock_duckdb_result)
+        mock_parquet_backend._has_text_db = False
+        rows = [{"episode_id": "ep1", "podcast_id": "pod1", "score": 1.0}] * 2
+        with patch.object(mock_parquet_backend, "_scan_turns", return_value=rows), \
+             patch.object(mock_parquet_backend, "local_turn_podcast_ids",
+                          return_value=["pod1"]):
+            results = mock_parquet_backend.search_episodes_by_text(
+                "podcast", mode="exact")
+        con.execute.assert_not_called()
+        assert results == [{"episode_id": "ep1", "podcast_id": "pod1",
+                            "match_count": 2, "best_score": 1.0}]
+
+
+class TestSearchEpisodesByTextBatch:
+    """Tests for search_episodes_by_text_batch."""
+
+    TURNS = [
+        {"turn_text": "hello there"},
+        {"turn_text": "and hello again, world"},
+        {"turn_text": "goodbye world", "episode_id": "ep2"},
+        {"turn_text": "HELLO", "episode_id": "ep3", "podcast_id": "pod2"},
+    ]
+
+    def _setup(self, backend, real_search_db):
+        backend._has_text_db = True
+        backend._search_db_con = real_search_db(self.TURNS)
+        return backend._search_db_con
+
+    def test_exact_matches_one_query_at_a_time(
+        self, mock_parquet_backend, real_search_db
+    ):
+        self._setup(mock_parquet_backend, real_search_db)
+        queries = ["hello", "world", "absent"]
+        batch = mock_parquet_backend.search_episodes_by_text_batch(
+            queries, mode="exact")
+        assert list(batch) == queries
+        for q in queries:
+            single = mock_parquet_backend.search_episodes_by_text(q, mode="exact")
+            assert sorted(batch[q], key=repr) == sorted(single, key=repr)
+
+    def test_limit_applies_per_query(self, mock_parquet_backend, real_search_db):
+        self._setup(mock_parquet_backend, real_search_db)
+        batch = mock_parquet_backend.search_episodes_by_text_batch(
+            ["hello", "world"], mode="exact", limit=1)
+        assert batch["hello"] == [{"episode_id": "ep1", "podcast_id": "pod1",
+                                   "match_count": 2, "best_score": 1.0}]
+        assert len(batch["world"]) == 1
+
+    def test_exact_batch_is_one_statement(self, mock_parquet_backend, real_search_db):
+        con = self._setup(mock_parquet_backend, real_search_db)
+        batch = mock_parquet_backend.search_episodes_by_text_batch(
+            ["hello", "world", "hello"], mode="exact")
+        assert list(batch) == ["hello", "world"]
+        assert con.execute.call_count == 1
+
+    def test_other_modes_run_per_query(self, mock_parquet_backend):
+        with patch.object(mock_parquet_backend, "search_episodes_by_text",
+                          side_effect=lambda q, **kw: [q]) as single, \
+             patch.object(mock_parquet_backend, "has_search_db",
+                          return_value=False):
+            batch = mock_parquet_backend.search_episodes_by_text_batch(
+                ["a", "b"], mode="regex", limit=3)
+        assert batch == {"a": ["a"], "b": ["b"]}
+        single.assert_any_call("a", mode="regex", limit=3)
+
+    def test_invalid_mode_raises_value_error(self, mock_parquet_backend):
+        with pytest.raises(ValueError, match="Invalid search mode"):
+            mock_parquet_backend.search_episodes_by_text_batch(["x"], mode="nope")
+
 
 # ===================================================================
 # search_by_speaker_name
@@ -316,6 +533,85 @@ class TestSearchBySpeakerName:
         expected_keys = {"episode_id", "podcast_id", "name_original", "role"}
         assert set(results[0].keys()) == expected_keys
 
+    def test_replaced_index_is_searched(
+        self, mock_parquet_backend, sample_speaker_index_df
+    ):
+        self._setup(mock_parquet_backend, sample_speaker_index_df)
+        assert mock_parquet_backend.search_by_speaker_name("bob")
+        self._setup(mock_parquet_backend, sample_speaker_index_df.iloc[:2])
+        assert mock_parquet_backend.search_by_speaker_name("bob") == []
+
+    def test_query_is_literal_not_regex(
+        self, mock_parquet_backend, sample_speaker_index_df
+    ):
+        self._setup(mock_parquet_backend, sample_speaker_index_df)
+        assert mock_parquet_backend.search_by_speaker_name("j.hn") == []
+
+    @pytest.mark.parametrize("query", ["j", "h s", "oe", "h\nj", "smith", "éx"])
+    def test_same_hits_with_and_without_hyperscan(
+        self, mock_parquet_backend, sample_speaker_index_df, query
+    ):
+        import sporc.parquet_backend as pb
+
+        df = sample_speaker_index_df.copy()
+        df.loc[4, "name_normalized"] = "Élodie X"
+        self._setup(mock_parquet_backend, df)
+        got = mock_parquet_backend.search_by_speaker_name(query)
+        with patch.object(pb, "hyperscan", None):
+            mock_parquet_backend._speaker_columns_cache = None
+            expected = mock_parquet_backend.search_by_speaker_name(query)
+        assert got == expected
+
+    def test_unknown_role_returns_empty(
+        self, mock_parquet_backend, sample_speaker_index_df
+    ):
+        self._setup(mock_parquet_backend, sample_speaker_index_df)
+        assert mock_parquet_backend.search_by_speaker_name(
+            "john", role="neither") == []
+
+    def test_index_built_from_concatenated_frames(
+        self, mock_parquet_backend, sample_speaker_index_df
+    ):
+        """An Arrow-backed name column may arrive in several chunks."""
+        df = pd.concat([sample_speaker_index_df.iloc[:3],
+                        sample_speaker_index_df.iloc[3:]], ignore_index=True)
+        self._setup(mock_parquet_backend, df)
+        assert len(mock_parquet_backend.search_by_speaker_name("jane")) == 2
+        assert len(mock_parquet_backend.search_by_speaker_name(
+            "bob jones", exact=True)) == 1
+
+    @pytest.mark.parametrize("categorical", [False, True])
+    def test_null_role_comes_back_as_none(
+        self, mock_parquet_backend, sample_speaker_index_df, categorical
+    ):
+        rows = sample_speaker_index_df.to_dict("list")
+        for col, value in [("name_normalized", "zed null"),
+                           ("name_original", "Zed Null"), ("role", None),
+                           ("episode_id", "ep4"), ("podcast_id", "pod2")]:
+            rows[col].append(value)
+        df = pd.DataFrame(rows)
+        if categorical:
+            df["role"] = df["role"].astype("category")
+        self._setup(mock_parquet_backend, df)
+        results = mock_parquet_backend.search_by_speaker_name("zed")
+        assert [r["role"] for r in results] == [None]
+        assert mock_parquet_backend.search_by_speaker_name(
+            "zed", role="host") == []
+        # The other rows keep their roles
+        assert {r["role"] for r in mock_parquet_backend.search_by_speaker_name(
+            "jane")} == {"guest", "host"}
+
+    def test_loaded_index_is_dictionary_encoded(self, tmp_parquet_layout):
+        from conftest import PID_WITH_TURNS
+
+        backend = ParquetBackend(tmp_parquet_layout)
+        results = backend.search_by_speaker_name("guest", role="guest")
+        assert backend._speaker_index_df["role"].dtype == "category"
+        assert backend._speaker_index_df["podcast_id"].dtype == "category"
+        assert len(results) == 4
+        assert {type(r["role"]) for r in results} == {str}
+        assert PID_WITH_TURNS in {r["podcast_id"] for r in results}
+
     def test_lazy_load_triggered_when_none(self, mock_parquet_backend):
         mock_parquet_backend._speaker_index_df = None
         with patch.object(
@@ -346,31 +642,23 @@ class TestSearchBySpeakerName:
 class TestConcordance:
     """Tests for concordance (KWIC) method."""
 
-    def _setup_backend(self, backend, mock_duckdb_result, turn_texts):
-        """Set up backend with DuckDB returning given turn texts."""
+    def _setup_backend(self, backend, real_search_db, turn_texts):
+        """Set up backend with a DuckDB holding the given turn texts."""
         # KWIC matches on the text, which lives in the optional text database
         # from 1.1 on. Both have to be present for the SQL path; with only the
         # index, concordance falls back to scanning Parquet.
         backend.has_search_db = lambda: True
         backend._ensure_search_db = lambda: None
         backend._has_text_db = True
-        columns = [
-            "episode_id", "podcast_id", "turn_text",
-            "speaker_role", "speaker_name", "start_time", "end_time",
-        ]
-        rows = [
-            ("ep1", "pod1", text, "host", "John", 0.0, 10.0)
-            for text in turn_texts
-        ]
-        result = mock_duckdb_result(columns, rows)
-        con = MagicMock()
-        con.execute.return_value = result
+        # The keyword is located and the windows cut in SQL, so the SQL has to
+        # actually run.
+        con = real_search_db([{"turn_text": t} for t in turn_texts])
         backend._search_db_con = con
         return con
 
-    def test_single_word_kwic(self, mock_parquet_backend, mock_duckdb_result):
+    def test_single_word_kwic(self, mock_parquet_backend, real_search_db):
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["the quick brown fox jumps over the lazy dog"]
         )
         results = mock_parquet_backend.concordance("fox")
@@ -380,9 +668,9 @@ class TestConcordance:
         assert "left_context" in results[0]
         assert "right_context" in results[0]
 
-    def test_multi_word_phrase(self, mock_parquet_backend, mock_duckdb_result):
+    def test_multi_word_phrase(self, mock_parquet_backend, real_search_db):
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["I think you know what I mean by that"]
         )
         results = mock_parquet_backend.concordance("you know")
@@ -391,19 +679,19 @@ class TestConcordance:
         keyword_words = results[0]["keyword"].split()
         assert len(keyword_words) == 2
 
-    def test_word_at_beginning(self, mock_parquet_backend, mock_duckdb_result):
+    def test_word_at_beginning(self, mock_parquet_backend, real_search_db):
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["Hello world how are you"]
         )
         results = mock_parquet_backend.concordance("Hello")
         assert len(results) == 1
         assert results[0]["left_context"] == ""
 
-    def test_word_at_end(self, mock_parquet_backend, mock_duckdb_result):
+    def test_word_at_end(self, mock_parquet_backend, real_search_db):
         """When keyword is last word, right_context should be short or empty."""
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["how are you today friend"]
         )
         results = mock_parquet_backend.concordance("friend")
@@ -411,44 +699,44 @@ class TestConcordance:
         # Verify result is returned (right_context content depends on word-index heuristic)
         assert isinstance(results[0]["right_context"], str)
 
-    def test_case_insensitive(self, mock_parquet_backend, mock_duckdb_result):
+    def test_case_insensitive(self, mock_parquet_backend, real_search_db):
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["The Quick Brown Fox"]
         )
         results = mock_parquet_backend.concordance("quick")
         assert len(results) == 1
 
-    def test_no_regex_match_filtered_out(self, mock_parquet_backend, mock_duckdb_result):
-        """ILIKE returned a row but re.search doesn't match (e.g. word boundary)."""
+    def test_no_regex_match_filtered_out(self, mock_parquet_backend, real_search_db):
+        """A turn the SQL filter rejects produces no KWIC row."""
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["there is no matching word here"]
         )
         results = mock_parquet_backend.concordance("xyz")
         assert len(results) == 0
 
-    def test_speaker_role_filter_in_sql(self, mock_parquet_backend, mock_duckdb_result):
+    def test_speaker_role_filter_in_sql(self, mock_parquet_backend, real_search_db):
         con = self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["hello world"]
         )
         mock_parquet_backend.concordance("hello", speaker_role="host")
         params = con.execute.call_args[0][1]
         assert "host" in params
 
-    def test_podcast_id_filter_in_sql(self, mock_parquet_backend, mock_duckdb_result):
+    def test_podcast_id_filter_in_sql(self, mock_parquet_backend, real_search_db):
         con = self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["hello world"]
         )
         mock_parquet_backend.concordance("hello", podcast_id="pod1")
         params = con.execute.call_args[0][1]
         assert "pod1" in params
 
-    def test_result_metadata_fields(self, mock_parquet_backend, mock_duckdb_result):
+    def test_result_metadata_fields(self, mock_parquet_backend, real_search_db):
         self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result,
+            mock_parquet_backend, real_search_db,
             ["the quick brown fox"]
         )
         results = mock_parquet_backend.concordance("quick")
@@ -460,8 +748,40 @@ class TestConcordance:
         }
         assert set(results[0].keys()) == expected_keys
 
+    def test_windows_are_cut_from_prefiltered_rows(
+        self, mock_parquet_backend, real_search_db
+    ):
+        con = self._setup_backend(
+            mock_parquet_backend, real_search_db,
+            ["one two three\tfour five  six seven", "nothing here"]
+        )
+        results = mock_parquet_backend.concordance("FOUR five", context_words=2)
+        assert [(r["left_context"], r["keyword"], r["right_context"])
+                for r in results] == [("two three", "four five", "six seven")]
+        sql = con.execute.call_args[0][0]
+        assert "regexp_matches" in sql
+
+    @pytest.mark.parametrize("word", ["ike", "you know", "Brown", "o", "fox",
+                                      "ς", "Σοφία", "straße"])
+    def test_sql_windows_match_the_scan_path(self, mock_parquet_backend,
+                                             real_search_db, word):
+        from sporc.parquet_backend import _kwic_rows
+
+        texts = ["I like you know the Brown fox", "  you\tknow  brown ",
+                 "no match at all", "Brownie points, you know?",
+                 # str.split() whitespace that RE2's \s does not cover
+                 "the\u00a0Brown fox\u2003yy", "you\u3000know\u00a0brown",
+                 # Case folding beyond ASCII: sigma's three forms, sharp s
+                 "ΣΟΦΊΑ και σοφία", "ο λόγος μας", "die STRASSE, die Straße"]
+        self._setup_backend(mock_parquet_backend, real_search_db, texts)
+        via_sql = mock_parquet_backend.concordance(word, context_words=2)
+        rows = [{"turn_text": t, "episode_id": "ep1", "podcast_id": "pod1",
+                 "speaker_role": "host", "speaker_name": "John",
+                 "start_time": 0.0, "end_time": 10.0} for t in texts]
+        assert via_sql == _kwic_rows(rows, word, 2)
+
     def test_text_comes_from_the_attached_text_database(
-        self, mock_parquet_backend, mock_duckdb_result
+        self, mock_parquet_backend, real_search_db
     ):
         """
         1.1 removed turn_text from turns_search.duckdb -- it nearly tripled the
@@ -471,7 +791,7 @@ class TestConcordance:
         happily, so only a real database caught it.
         """
         con = self._setup_backend(
-            mock_parquet_backend, mock_duckdb_result, ["hello world"]
+            mock_parquet_backend, real_search_db, ["hello world"]
         )
         mock_parquet_backend.concordance("hello")
         sql = con.execute.call_args[0][0]
@@ -524,6 +844,36 @@ class TestGetEpisodeMetrics:
         result = mock_parquet_backend.get_episode_metrics("nonexistent")
         assert result is None
 
+    def test_duplicate_id_returns_first_row(
+        self, mock_parquet_backend, sample_episode_metrics_df
+    ):
+        df = sample_episode_metrics_df.copy()
+        df.loc[2, "episode_id"] = "ep1"
+        mock_parquet_backend._episode_metrics_df = df
+        assert mock_parquet_backend.get_episode_metrics("ep1")[
+            "total_word_count"] == 3000
+        assert mock_parquet_backend.get_episode_metrics("ep0") is None
+        assert mock_parquet_backend.get_episode_metrics("ep9") is None
+
+    def test_repeat_lookup_is_cached_and_copied(
+        self, mock_parquet_backend, sample_episode_metrics_df
+    ):
+        mock_parquet_backend._episode_metrics_df = sample_episode_metrics_df
+        first = mock_parquet_backend.get_episode_metrics("ep2")
+        first["total_word_count"] = -1
+        with patch.object(pd.DataFrame, "__getitem__",
+                          side_effect=AssertionError("re-scanned")):
+            again = mock_parquet_backend.get_episode_metrics("ep2")
+        assert again["total_word_count"] == 5000
+
+    def test_replaced_metrics_drop_the_cache(
+        self, mock_parquet_backend, sample_episode_metrics_df
+    ):
+        mock_parquet_backend._episode_metrics_df = sample_episode_metrics_df
+        assert mock_parquet_backend.get_episode_metrics("ep3") is not None
+        mock_parquet_backend._episode_metrics_df = sample_episode_metrics_df.iloc[:2]
+        assert mock_parquet_backend.get_episode_metrics("ep3") is None
+
 
 class TestFilterEpisodesByMetrics:
     """Tests for filter_episodes_by_metrics method."""
@@ -600,6 +950,43 @@ class TestFilterEpisodesByMetrics:
         assert len(results) == 1
         assert results[0]["episode_id"] == "ep2"
 
+    def test_missing_value_fails_any_bound(
+        self, mock_parquet_backend, sample_episode_metrics_df
+    ):
+        df = sample_episode_metrics_df.copy()
+        df.loc[1, "avg_gap_duration"] = float("nan")
+        self._setup(mock_parquet_backend, df)
+        results = mock_parquet_backend.filter_episodes_by_metrics(min_avg_gap=0.0)
+        assert [r["episode_id"] for r in results] == ["ep1", "ep3"]
+
+    def test_replaced_metrics_are_filtered(
+        self, mock_parquet_backend, sample_episode_metrics_df
+    ):
+        self._setup(mock_parquet_backend, sample_episode_metrics_df)
+        assert len(mock_parquet_backend.filter_episodes_by_metrics(
+            min_word_count=4000)) == 2
+        self._setup(mock_parquet_backend, sample_episode_metrics_df.iloc[:2])
+        assert len(mock_parquet_backend.filter_episodes_by_metrics(
+            min_word_count=4000)) == 1
+
+    @pytest.mark.parametrize("kwargs", [
+        {}, {"min_word_count": 10}, {"max_avg_gap": 1.0, "min_speaking_rate": 1.0},
+        {"min_turn_count": 10 ** 6}, {"limit": 1},
+    ])
+    def test_results_do_not_depend_on_what_loaded_first(
+        self, tmp_parquet_layout, kwargs
+    ):
+        """The first call loads the catalog; the same call then gives the same rows."""
+        backend = ParquetBackend(tmp_parquet_layout)
+        got = backend.filter_episodes_by_metrics(**kwargs)
+        assert backend._episode_metrics_df is not None
+        assert got == backend.filter_episodes_by_metrics(**kwargs)
+
+    def test_limit_keeps_catalog_order(self, tmp_parquet_layout):
+        backend = ParquetBackend(tmp_parquet_layout)
+        got = backend.filter_episodes_by_metrics(limit=2)
+        assert got == backend._episode_metrics_df.head(2).to_dict(orient="records")
+
     def test_impossible_criteria_returns_empty(
         self, mock_parquet_backend, sample_episode_metrics_df
     ):
@@ -774,3 +1161,23 @@ class TestEstimateWordAudio:
             )
             assert result is not None
             assert abs(result["estimated_start"] - 15.56) < 0.1
+
+    def test_overlapping_occurrences_counted(self, mock_parquet_backend):
+        turns = [self._make_turn("aaa", start=0.0, end=3.0)]
+        with patch.object(
+            mock_parquet_backend, "get_turns_for_episode", return_value=turns
+        ):
+            result = mock_parquet_backend.estimate_word_audio(
+                "pod1", "ep1", "aa", occurrence=1
+            )
+            assert result["estimated_start"] == 1.0
+
+    def test_word_is_matched_literally(self, mock_parquet_backend):
+        turns = [self._make_turn("costs $5 (approx.)")]
+        with patch.object(
+            mock_parquet_backend, "get_turns_for_episode", return_value=turns
+        ):
+            assert mock_parquet_backend.estimate_word_audio(
+                "pod1", "ep1", "(approx.)") is not None
+            assert mock_parquet_backend.estimate_word_audio(
+                "pod1", "ep1", "c.sts") is None
@@ -6,6 +6,7 @@ get_all_podcasts() survive a fully-passing run: it only fires on the warm-cache
 path, which a mock never takes. These tests read real files instead.
 """
 
+import dataclasses
 import os
 import time
 
@@ -110,6 +111,33 @@ class TestTurnCoverage:
         assert len(ep.turns) == 2
         assert ep.has_turn_data is True
 
+    def test_repeated_labels_share_one_string(self, tmp_parquet_layout):
+        ds = SPORCDataset(parquet_dir=tmp_parquet_layout)
+        pod = ds.search_podcast("Long Turns Podcast")
+        turns = max((e.turns for e in pod.episodes), key=len)
+        by_label = {}
+        for t in turns:
+            for label in t.speaker + [t.inferred_speaker_role]:
+                if label is not None:
+                    assert by_label.setdefault(label, label) is label
+
+    def test_loaded_turns_are_handed_out_as_copies(self, tmp_parquet_layout):
+        ds = SPORCDataset(parquet_dir=tmp_parquet_layout)
+        ep = max(ds.search_podcast("Long Turns Podcast").episodes,
+                 key=lambda e: e.turn_count)
+        turns = ep.turns
+        assert isinstance(turns, list)
+        turns.pop()
+        assert ep.turn_count == len(turns) + 1
+
+    def test_loaded_episode_equals_one_built_by_hand(self, tmp_parquet_layout):
+        """Backend-loaded and hand-built episodes hold turns the same way."""
+        ds = SPORCDataset(parquet_dir=tmp_parquet_layout)
+        ep = max(ds.search_podcast("Long Turns Podcast").episodes,
+                 key=lambda e: e.turn_count)
+        ep.turns  # load them
+        assert dataclasses.replace(ep, _turns=list(ep._turns)) == ep
+
     def test_podcast_without_turns_partition(self, tmp_parquet_layout):
         ds = SPORCDataset(parquet_dir=tmp_parquet_layout)
         ep = ds.search_podcast("No Turns Podcast").episodes[0]
@@ -295,6 +323,12 @@ class TestSearchWithoutIndex:
                   "speaker_name", "word_count", "score"):
             assert k in hits[0]
 
+    def test_as_table_matches_the_dicts(self, tmp_parquet_layout):
+        ds = SPORCDataset(parquet_dir=tmp_parquet_layout)
+        table = ds.search_turns("hello", as_table=True)
+        assert table.to_pylist() == ds.search_turns("hello")
+        assert ds.search_turns("nonexistentxyz", as_table=True).num_rows == 0
+
     def test_exact_and_regex_modes(self, tmp_parquet_layout):
         ds = SPORCDataset(parquet_dir=tmp_parquet_layout)
         assert len(ds.search_turns("WORLD", mode="exact")) == 1     # case-insensitive
@@ -423,6 +457,15 @@ class TestRestrictToPodcasts:
         assert stats["total_podcasts"] == 1
         assert stats["total_episodes"] == 2
 
+    def test_statistics_are_cached_per_restriction(self, tmp_parquet_layout):
+        backend = ParquetBackend(tmp_parquet_layout)
+        first = backend.get_statistics()
+        first["total_episodes"] = -1            # a copy: the cache is untouched
+        assert backend.get_statistics()["total_episodes"] == 4
+
+        backend.restrict_to_podcasts([PID_WITH_TURNS])
+        assert backend.get_statistics()["total_episodes"] == 2
+
     def test_none_lifts_the_restriction(self, tmp_parquet_layout):
         backend = ParquetBackend(tmp_parquet_layout)
         backend.restrict_to_podcasts([PID_WITH_TURNS])
@@ -472,6 +472,25 @@ class TestLobanovSpeakerIdentity:
 
         assert "unidentified speakers" in caplog.text
 
+    def test_dropped_placeholders_are_not_listed_when_info_is_off(
+            self, monkeypatch, caplog):
+        import logging
+
+        import sporc.phonetics as ph
+
+        specs = [("p1", "NO_INFERRED_SPEAKER", 700, 1200) for _ in range(4)]
+        specs += [("p1", "Ann Real", 800 + i * 10, 1300 + i * 10) for i in range(4)]
+        listed = []
+        monkeypatch.setattr(ph, "sorted", lambda xs: listed.append(xs) or list(xs),
+                            raising=False)
+
+        with caplog.at_level(logging.WARNING, logger="sporc.phonetics"):
+            out = ph.lobanov_normalize(self._rows(specs), min_tokens=3)
+
+        assert len(out) == 4
+        assert listed == []
+        assert "unidentified speakers" not in caplog.text
+
     def test_null_podcast_id_does_not_discard_tokens(self):
         # pandas 3 makes a null part poison the whole concatenated key (NA),
         # and groupby drops NA keys -- so this silently returned nothing at all
@@ -4,7 +4,17 @@ from sporc.episode import Episode
 from datetime import datetime
 from sporc.constants import SUBCATEGORIES, MAIN_CATEGORIES
 
-@pytest.fixture
+# Any member will do for the category tests; next(iter(...)) avoids copying the
+# whole collection into a list just to take its first element.
+_FIRST_SUB = next(iter(SUBCATEGORIES))
+_FIRST_MAIN = next(iter(MAIN_CATEGORIES))
+
+_EXPECTED_CATS = frozenset({"Tech", "Science", "Education"})
+
+# Module scope: most tests only read from the podcast, so build the episodes
+# and podcast once. Tests that add or remove episodes use mutable_podcast,
+# which is rebuilt per test around a copy of the episode list.
+@pytest.fixture(scope="module")
 def sample_episodes():
     return [
         Episode(
@@ -55,7 +65,7 @@ def sample_episodes():
         ),
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_podcast(sample_episodes):
     podcast = Podcast(
         title="Test Podcast",
@@ -65,15 +75,48 @@ def sample_podcast(sample_episodes):
     )
     return podcast
 
-def test_podcast_properties(sample_podcast):
-    assert sample_podcast.num_episodes == 3
-    assert sample_podcast.host_names == ["Bob", "Charlie"]
-    assert sample_podcast.guest_names == ["Alice", "David"]
-    assert set(sample_podcast.categories) == {"Tech", "Science", "Education"}
-    assert sample_podcast.primary_category == "Tech"  # Most common
-    assert sample_podcast.total_duration_seconds == 3600.0  # 1860 + 1200 + 540
-    assert sample_podcast.total_duration_hours == 1.0
-    assert sample_podcast.avg_episode_duration_minutes == 20.0
+@pytest.fixture
+def mutable_podcast(sample_episodes):
+    """A per-test podcast for tests that add or remove episodes.
+
+    It holds its own copy of the episode list, so changes never reach the
+    shared ``sample_podcast``.
+    """
+    return Podcast(
+        title="Test Podcast",
+        description="A test podcast",
+        rss_url="http://example.com/rss.xml",
+        episodes=list(sample_episodes),
+    )
+
+@pytest.fixture(scope="module")
+def podcast_stats(sample_podcast):
+    return sample_podcast.get_episode_statistics()
+
+@pytest.fixture(scope="module")
+def podcast_dict(sample_podcast):
+    return sample_podcast.to_dict()
+
+def _lookup(mapping, dotted_key):
+    """Follow a dotted key such as ``"episode_types.solo"`` into nested dicts."""
+    for part in dotted_key.split("."):
+        mapping = mapping[part]
+    return mapping
+
+@pytest.mark.parametrize("attr, expected", [
+    ("num_episodes", 3),
+    ("host_names", ["Bob", "Charlie"]),
+    ("guest_names", ["Alice", "David"]),
+    ("primary_category", "Tech"),  # Most common
+    ("total_duration_seconds", pytest.approx(3600.0)),  # 1860 + 1200 + 540
+    ("total_duration_hours", pytest.approx(1.0)),
+    ("avg_episode_duration_minutes", pytest.approx(20.0)),
+])
+def test_podcast_properties(sample_podcast, attr, expected):
+    assert getattr(sample_podcast, attr) == expected
+
+def test_podcast_derived_properties(sample_podcast):
+    assert frozenset(sample_podcast.categories) == _EXPECTED_CATS
     assert sample_podcast.shortest_episode.title == "Episode 3"
     assert sample_podcast.longest_episode.title == "Episode 1"
     assert sample_podcast.earliest_episode_date is not None
@@ -132,23 +175,27 @@ def test_episode_search_methods(sample_podcast):
     assert len(date_episodes) >= 0
     assert len(date_episodes) <= 3
 
-def test_podcast_statistics(sample_podcast):
-    stats = sample_podcast.get_episode_statistics()
-    assert stats['num_episodes'] == 3
-    assert stats['total_duration_hours'] == 1.0
-    assert stats['avg_episode_duration_minutes'] == 20.0
-    assert stats['min_episode_duration_minutes'] == 9.0
-    assert stats['max_episode_duration_minutes'] == 31.0
-    assert stats['median_episode_duration_minutes'] == 20.0
-    assert stats['episode_types']['solo'] == 0
-    assert stats['episode_types']['interview'] == 2
-    assert stats['episode_types']['panel'] == 0  # Fixed expectation
-    assert stats['host_names'] == ["Bob", "Charlie"]
-    assert stats['guest_names'] == ["Alice", "David"]
-    assert stats['date_range']['earliest'] is not None
-    assert stats['date_range']['latest'] is not None
-
-def test_podcast_manipulation_methods(sample_podcast):
+@pytest.mark.parametrize("key, expected", [
+    ("num_episodes", 3),
+    ("total_duration_hours", pytest.approx(1.0)),
+    ("avg_episode_duration_minutes", pytest.approx(20.0)),
+    ("min_episode_duration_minutes", pytest.approx(9.0)),
+    ("max_episode_duration_minutes", pytest.approx(31.0)),
+    ("median_episode_duration_minutes", pytest.approx(20.0)),
+    ("episode_types.solo", 0),
+    ("episode_types.interview", 2),
+    ("episode_types.panel", 0),  # Fixed expectation
+    ("host_names", ["Bob", "Charlie"]),
+    ("guest_names", ["Alice", "David"]),
+])
+def test_podcast_statistics(podcast_stats, key, expected):
+    assert _lookup(podcast_stats, key) == expected
+
+def test_podcast_statistics_date_range(podcast_stats):
+    assert podcast_stats['date_range']['earliest'] is not None
+    assert podcast_stats['date_range']['latest'] is not None
+
+def test_podcast_manipulation_methods(mutable_podcast):
     # Add episode
     new_episode = Episode(
         title="Episode 4",
@@ -164,12 +211,12 @@ def test_podcast_manipulation_methods(sample_podcast):
         guest_predicted_names=[],
         main_ep_speakers=["Bob"],
     )
-    sample_podcast.add_episode(new_episode)
-    assert sample_podcast.num_episodes == 4
+    mutable_podcast.add_episode(new_episode)
+    assert mutable_podcast.num_episodes == 4
 
     # Remove episode
-    sample_podcast.remove_episode(new_episode)
-    assert sample_podcast.num_episodes == 3
+    mutable_podcast.remove_episode(new_episode)
+    assert mutable_podcast.num_episodes == 3
 
 def test_podcast_error_cases():
     # Add episode with wrong podcast title
@@ -206,9 +253,9 @@ def test_empty_podcast():
     assert empty_podcast.guest_names == []
     assert empty_podcast.categories == []
     assert empty_podcast.primary_category is None
-    assert empty_podcast.total_duration_seconds == 0.0
-    assert empty_podcast.total_duration_hours == 0.0
-    assert empty_podcast.avg_episode_duration_minutes == 0.0
+    assert empty_podcast.total_duration_seconds == pytest.approx(0.0)
+    assert empty_podcast.total_duration_hours == pytest.approx(0.0)
+    assert empty_podcast.avg_episode_duration_minutes == pytest.approx(0.0)
     assert empty_podcast.shortest_episode is None
     assert empty_podcast.longest_episode is None
     assert empty_podcast.earliest_episode_date is None
@@ -219,25 +266,40 @@ def test_empty_podcast():
     assert len(empty_podcast.long_form_episodes) == 0
     assert len(empty_podcast.short_form_episodes) == 0
 
-    # Test statistics for empty podcast
+    # Test statistics for empty podcast: build each dict once and check the
+    # fields that matter against it.
     stats = empty_podcast.get_episode_statistics()
     assert stats['num_episodes'] == 0
-    assert stats['total_duration_hours'] == 0.0
-    assert stats['avg_episode_duration_minutes'] == 0.0
-
-def test_podcast_to_dict(sample_podcast):
-    d = sample_podcast.to_dict()
-    assert d['title'] == "Test Podcast"
-    assert d['num_episodes'] == 3
-    assert d['total_duration_hours'] == 1.0
-    assert d['avg_episode_duration_minutes'] == 20.0
-    assert d['host_names'] == ["Bob", "Charlie"]
-    assert d['guest_names'] == ["Alice", "David"]
-    assert set(d['categories']) == {"Tech", "Science", "Education"}
-    assert d['primary_category'] == "Tech"
-    assert d['episode_types']['solo'] == 0
-    assert d['episode_types']['interview'] == 2
-    assert d['episode_types']['panel'] == 0  # Fixed expectation
+    assert stats['total_duration_hours'] == pytest.approx(0.0)
+    assert stats['avg_episode_duration_minutes'] == pytest.approx(0.0)
+    assert stats['date_range'] is None
+
+    d = empty_podcast.to_dict()
+    assert d['num_episodes'] == 0
+    assert d['total_duration_hours'] == pytest.approx(0.0)
+    assert d['host_names'] == []
+    assert d['categories'] == []
+    assert d['primary_category'] is None
+    assert d['date_range'] == {'earliest': None, 'latest': None}
+    assert set(d['episode_types'].values()) == {0}
+
+@pytest.mark.parametrize("key, expected", [
+    ("title", "Test Podcast"),
+    ("num_episodes", 3),
+    ("total_duration_hours", pytest.approx(1.0)),
+    ("avg_episode_duration_minutes", pytest.approx(20.0)),
+    ("host_names", ["Bob", "Charlie"]),
+    ("guest_names", ["Alice", "David"]),
+    ("primary_category", "Tech"),
+    ("episode_types.solo", 0),
+    ("episode_types.interview", 2),
+    ("episode_types.panel", 0),  # Fixed expectation
+])
+def test_podcast_to_dict(podcast_dict, key, expected):
+    assert _lookup(podcast_dict, key) == expected
+
+def test_podcast_to_dict_categories(podcast_dict):
+    assert frozenset(podcast_dict['categories']) == _EXPECTED_CATS
 
 def test_podcast_str_and_repr(sample_podcast):
     s = str(sample_podcast)
@@ -281,7 +343,7 @@ def test_podcast_category_properties():
         podcast_description="d",
         rss_url="r",
         category1="Tech",
-        category2=list(SUBCATEGORIES)[0],
+        category2=_FIRST_SUB,
         host_predicted_names=["A"],
         guest_predicted_names=[],
         main_ep_speakers=["A"],
@@ -295,8 +357,8 @@ def test_podcast_category_properties():
         podcast_title="P",
         podcast_description="d",
         rss_url="r",
-        category1=list(MAIN_CATEGORIES)[0],
-        category2=list(SUBCATEGORIES)[0],
+        category1=_FIRST_MAIN,
+        category2=_FIRST_SUB,
         host_predicted_names=["B"],
         guest_predicted_names=[],
         main_ep_speakers=["B"],
@@ -308,13 +370,13 @@ def test_podcast_category_properties():
         episodes=[ep1, ep2],
     )
     # subcategories property
-    assert list(SUBCATEGORIES)[0] in podcast.subcategories
+    assert _FIRST_SUB in podcast.subcategories
     # main_categories property
-    assert "Tech" in podcast.main_categories or list(MAIN_CATEGORIES)[0] in podcast.main_categories
+    assert "Tech" in podcast.main_categories or _FIRST_MAIN in podcast.main_categories
     # primary_subcategory property
-    assert podcast.primary_subcategory == list(SUBCATEGORIES)[0]
+    assert podcast.primary_subcategory == _FIRST_SUB
 
-def test_podcast_remove_episode_edge_case(sample_podcast):
+def test_podcast_remove_episode_edge_case(mutable_podcast):
     # Remove episode not in list
     ep = Episode(
         title="NotInList",
@@ -326,6 +388,6 @@ def test_podcast_remove_episode_edge_case(sample_podcast):
         podcast_description="desc",
         rss_url="url",
     )
-    before = sample_podcast.num_episodes
-    sample_podcast.remove_episode(ep)  # Should not raise
-    assert sample_podcast.num_episodes == before
\ No newline at end of file
+    before = mutable_podcast.num_episodes
+    mutable_podcast.remove_episode(ep)  # Should not raise
+    assert mutable_podcast.num_episodes == before
\ No newline at end of file
@@ -3,12 +3,6 @@ Tests for sliding window functionality in the Episode class.
 """
 
 import unittest
-from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add the parent directory to the path to import sporc
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sporc.episode import Episode, TurnWindow, TimeRangeBehavior
 from sporc.turn import Turn
@@ -17,10 +11,10 @@ from sporc.turn import Turn
 class TestTurnWindow(unittest.TestCase):
     """Test the TurnWindow class."""
 
-    def setUp(self):
-        """Set up test data."""
-        # Create mock turns
-        self.turns = [
+    @classmethod
+    def setUpClass(cls):
+        """Build the test turns once; the tests only read them."""
+        cls._turns = [
             Turn(
                 speaker=["SPEAKER_00"],
                 text="Hello, welcome to the podcast.",
@@ -73,6 +67,10 @@ class TestTurnWindow(unittest.TestCase):
             )
         ]
 
+    def setUp(self):
+        """Set up test data."""
+        self.turns = list(self._turns)
+
         # Create a TurnWindow
         self.window = TurnWindow(
             turns=self.turns,
@@ -85,18 +83,19 @@ class TestTurnWindow(unittest.TestCase):
 
     def test_basic_properties(self):
         """Test basic window properties."""
-        self.assertEqual(self.window.size, 5)
-        self.assertEqual(self.window.window_index, 0)
-        self.assertEqual(self.window.start_index, 0)
-        self.assertEqual(self.window.end_index, 5)
-        self.assertEqual(self.window.total_windows, 3)
-        self.assertEqual(self.window.overlap_size, 2)
+        window = self.window
+        self.assertEqual(
+            (window.size, window.window_index, window.start_index,
+             window.end_index, window.total_windows, window.overlap_size),
+            (5, 0, 0, 5, 3, 2),
+        )
 
     def test_window_position_properties(self):
         """Test window position properties."""
-        self.assertTrue(self.window.is_first)
-        self.assertFalse(self.window.is_last)
-        self.assertTrue(self.window.has_overlap)
+        self.assertEqual(
+            (self.window.is_first, self.window.is_last, self.window.has_overlap),
+            (True, False, True),
+        )
 
         # Test last window
         last_window = TurnWindow(
@@ -107,8 +106,7 @@ class TestTurnWindow(unittest.TestCase):
             total_windows=3,
             overlap_size=2
         )
-        self.assertFalse(last_window.is_first)
-        self.assertTrue(last_window.is_last)
+        self.assertEqual((last_window.is_first, last_window.is_last), (False, True))
 
     def test_overlap_turns(self):
         """Test overlap turns functionality."""
@@ -192,14 +190,11 @@ class TestTurnWindow(unittest.TestCase):
 
     def test_get_text(self):
         """Test text combination."""
-        text = self.window.get_text()
-        expected = "Hello, welcome to the podcast. Thanks for having me. Let's talk about the topic. That sounds interesting. What do you think?"
-        self.assertEqual(text, expected)
+        texts = [turn.text for turn in self.turns]
+        self.assertEqual(self.window.get_text(), " ".join(texts))
 
         # Test with custom separator
-        text_with_sep = self.window.get_text(separator=" | ")
-        expected_with_sep = "Hello, welcome to the podcast. | Thanks for having me. | Let's talk about the topic. | That sounds interesting. | What do you think?"
-        self.assertEqual(text_with_sep, expected_with_sep)
+        self.assertEqual(self.window.get_text(separator=" | "), " | ".join(texts))
 
     def test_to_dict(self):
         """Test dictionary conversion."""
@@ -231,6 +226,24 @@ class TestTurnWindow(unittest.TestCase):
 class TestEpisodeSlidingWindow(unittest.TestCase):
     """Test sliding window functionality in the Episode class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the test turns once; the tests only read them."""
+        # start_time increases with i, so the list is already in order
+        cls._template_turns = [
+            Turn(
+                speaker=["SPEAKER_00"],
+                text=f"Turn {i}",
+                start_time=i * 2.0,
+                end_time=(i + 1) * 2.0,
+                duration=2.0,
+                turn_count=i,
+                inferred_speaker_name=f"Speaker_{i % 2}",
+                inferred_speaker_role="host" if i % 2 == 0 else "guest"
+            )
+            for i in range(10)  # 10 turns
+        ]
+
     def setUp(self):
         """Set up test episode with turns."""
         # Create a test episode
@@ -245,75 +258,53 @@ class TestEpisodeSlidingWindow(unittest.TestCase):
             rss_url="test.rss"
         )
 
-        # Create test turns
-        self.turns = [
-            Turn(
-                speaker=["SPEAKER_00"],
-                text=f"Turn {i}",
-                start_time=i * 2.0,
-                end_time=(i + 1) * 2.0,
-                duration=2.0,
-                turn_count=i,
-                inferred_speaker_name=f"Speaker_{i % 2}",
-                inferred_speaker_role="host" if i % 2 == 0 else "guest"
-            )
-            for i in range(10)  # 10 turns
-        ]
-
         # Load turns directly into episode
-        self.episode._turns = sorted(self.turns, key=lambda t: t.start_time)
+        self.episode._turns = list(self._template_turns)
         self.episode._turns_loaded = True
 
-    def test_sliding_window_basic(self):
-        """Test basic sliding window functionality."""
-        windows = list(self.episode.sliding_window(window_size=3, overlap=1))
-
-        self.assertEqual(len(windows), 4)  # Should create 4 windows
-
-        # Check first window
-        first_window = windows[0]
-        self.assertEqual(first_window.window_index, 0)
-        self.assertEqual(first_window.size, 3)
-        self.assertEqual(first_window.start_index, 0)
-        self.assertEqual(first_window.end_index, 3)
-        self.assertEqual(first_window.overlap_size, 0)  # First window has no overlap
-        self.assertEqual(len(first_window.new_turns), 3)
-        self.assertEqual(len(first_window.overlap_turns), 0)
-
-        # Check second window
-        second_window = windows[1]
-        self.assertEqual(second_window.window_index, 1)
-        self.assertEqual(second_window.size, 3)
-        self.assertEqual(second_window.start_index, 2)
-        self.assertEqual(second_window.end_index, 5)
-        self.assertEqual(second_window.overlap_size, 1)
-        self.assertEqual(len(second_window.new_turns), 2)
-        self.assertEqual(len(second_window.overlap_turns), 1)
-
-    def test_sliding_window_no_overlap(self):
-        """Test sliding window with no overlap."""
-        windows = list(self.episode.sliding_window(window_size=3, overlap=0))
-
-        self.assertEqual(len(windows), 3)  # Should create 3 windows (10 turns, size 3, step 3)
-
-        for i, window in enumerate(windows):
-            self.assertEqual(window.window_index, i)
-            self.assertEqual(window.size, 3)
-            self.assertEqual(window.overlap_size, 0 if i == 0 else 0)
-            self.assertEqual(len(window.new_turns), 3)
-            self.assertEqual(len(window.overlap_turns), 0)
-
-    def test_sliding_window_high_overlap(self):
-        """Test sliding window with high overlap."""
-        windows = list(self.episode.sliding_window(window_size=5, overlap=3))
-
-        self.assertEqual(len(windows), 3)  # Should create 3 windows (10 turns, size 5, step 2)
-
-        # Check overlap behavior
-        for i, window in enumerate(windows[1:], 1):
-            self.assertEqual(window.overlap_size, 3)
-            self.assertEqual(len(window.overlap_turns), 3)
-            self.assertEqual(len(window.new_turns), 2)
+    def test_sliding_window_shapes(self):
+        """Test window layout for several size/overlap combinations."""
+        # 10 turns; windows advance by window_size - overlap and a trailing
+        # partial window is dropped.
+        cases = [
+            (3, 1, 4),  # step 2
+            (3, 0, 3),  # step 3, no overlap
+            (5, 3, 3),  # step 2, high overlap
+        ]
+        for window_size, overlap, expected_count in cases:
+            with self.subTest(window_size=window_size, overlap=overlap):
+                windows = self.episode.sliding_window(
+                    window_size=window_size, overlap=overlap)
+
+                step = window_size - overlap
+                count = 0
+                for i, window in enumerate(windows):
+                    count += 1
+                    # First window has no overlap
+                    expected_overlap = 0 if i == 0 else overlap
+                    self.assertEqual(window.window_index, i)
+                    self.assertEqual(window.size, window_size)
+                    self.assertEqual(window.start_index, i * step)
+                    self.assertEqual(window.end_index, i * step + window_size)
+                    self.assertEqual(window.overlap_size, expected_overlap)
+                    self.assertEqual(len(window.overlap_turns), expected_overlap)
+                    self.assertEqual(len(window.new_turns),
+                                     window_size - expected_overlap)
+                self.assertEqual(count, expected_count)
+
+    def test_sliding_window_is_lazy(self):
+        """Test that windows are produced one at a time."""
+        windows = self.episode.sliding_window(window_size=3, overlap=1)
+
+        first = next(windows)
+        self.assertEqual(first.window_index, 0)
+        self.assertEqual(first.total_windows, 4)
+        second = next(windows)
+        self.assertEqual(second.window_index, 1)
+        self.assertEqual(second.start_index, 2)
+
+        remaining = sum(1 for _ in windows)
+        self.assertEqual(remaining + 2, 4)
 
     def test_sliding_window_validation(self):
         """Test sliding window parameter validation."""
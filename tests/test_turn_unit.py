@@ -1,39 +1,60 @@
+import pickle
+import sys
+
 import pytest
 from sporc.turn import Turn
 
-@pytest.fixture
+EXPECTED_AUDIO_FEATURES = {
+    "mfcc1_sma3_mean": 0.1,
+    "mfcc2_sma3_mean": 0.2,
+    "mfcc3_sma3_mean": 0.3,
+    "mfcc4_sma3_mean": 0.4,
+    "f0_semitone_from_27_5hz_sma3nz_mean": 0.5,
+    "f1_frequency_sma3nz_mean": 0.6,
+}
+
+_BASIC_KWARGS = dict(
+    speaker=["SPEAKER_00"],
+    text="Hello world this is a test",
+    start_time=0.0,
+    end_time=5.0,
+    duration=5.0,
+    turn_count=1,
+    inferred_speaker_role="host",
+    inferred_speaker_name="Bob",
+    mp3_url="http://example.com/ep.mp3",
+    **EXPECTED_AUDIO_FEATURES,
+)
+
+_OVERLAPPING_KWARGS = dict(
+    speaker=["SPEAKER_00", "SPEAKER_01"],
+    text="Overlapping turn",
+    start_time=2.0,
+    end_time=7.0,
+    duration=5.0,
+    turn_count=2,
+    inferred_speaker_role="guest",
+    inferred_speaker_name="Alice",
+    mp3_url="http://example.com/ep.mp3",
+)
+
+# Module scope: every test only reads these turns. A test that needs to change
+# a turn should build its own rather than narrowing the fixture scope. Turn
+# does not modify its speaker list, so the kwargs' lists can be shared too.
+@pytest.fixture(scope="module")
 def basic_turn():
-    return Turn(
-        speaker=["SPEAKER_00"],
-        text="Hello world this is a test",
-        start_time=0.0,
-        end_time=5.0,
-        duration=5.0,
-        turn_count=1,
-        inferred_speaker_role="host",
-        inferred_speaker_name="Bob",
-        mfcc1_sma3_mean=0.1,
-        mfcc2_sma3_mean=0.2,
-        mfcc3_sma3_mean=0.3,
-        mfcc4_sma3_mean=0.4,
-        f0_semitone_from_27_5hz_sma3nz_mean=0.5,
-        f1_frequency_sma3nz_mean=0.6,
-        mp3_url="http://example.com/ep.mp3",
-    )
-
-@pytest.fixture
+    return Turn(**_BASIC_KWARGS)
+
+@pytest.fixture(scope="module")
 def overlapping_turn():
-    return Turn(
-        speaker=["SPEAKER_00", "SPEAKER_01"],
-        text="Overlapping turn",
-        start_time=2.0,
-        end_time=7.0,
-        duration=5.0,
-        turn_count=2,
-        inferred_speaker_role="guest",
-        inferred_speaker_name="Alice",
-        mp3_url="http://example.com/ep.mp3",
-    )
+    return Turn(**_OVERLAPPING_KWARGS)
+
+def _turn(**kw):
+    """A valid minimal turn, with any fields overridden by ``kw``."""
+    base = dict(speaker=["SPEAKER_00"], text="words here", start_time=0.0,
+                end_time=1.0, duration=1.0, turn_count=0)
+    base.update(kw)
+    return Turn(**base)
 
 def test_turn_properties_and_audio_features(basic_turn):
     assert basic_turn.is_overlapping is False
@@ -42,19 +63,14 @@ def test_turn_properties_and_audio_features(basic_turn):
     assert basic_turn.is_guest is False
     assert basic_turn.word_count == 6
     assert basic_turn.words_per_second == 6 / 5.0
-    features = basic_turn.get_audio_features()
-    assert features["mfcc1_sma3_mean"] == 0.1
-    assert features["mfcc2_sma3_mean"] == 0.2
-    assert features["mfcc3_sma3_mean"] == 0.3
-    assert features["mfcc4_sma3_mean"] == 0.4
-    assert features["f0_semitone_from_27_5hz_sma3nz_mean"] == 0.5
-    assert features["f1_frequency_sma3nz_mean"] == 0.6
+    # Only the features that were set come back; the stdevs are all None here.
+    assert basic_turn.get_audio_features() == EXPECTED_AUDIO_FEATURES
     d = basic_turn.to_dict()
     assert d["speaker"] == ["SPEAKER_00"]
     assert d["primary_speaker"] == "SPEAKER_00"
     assert d["inferred_speaker_role"] == "host"
     assert d["inferred_speaker_name"] == "Bob"
-    assert d["audio_features"]["mfcc1_sma3_mean"] == 0.1
+    assert d["audio_features"] == EXPECTED_AUDIO_FEATURES
     assert d["mp3_url"] == "http://example.com/ep.mp3"
     assert str(basic_turn).startswith("Turn(")
     assert "Hello world" in repr(basic_turn)  # Text is present if short
@@ -70,33 +86,22 @@ def test_turn_overlapping_and_contains_time(basic_turn, overlapping_turn):
     assert basic_turn.overlaps_with(overlapping_turn) is True
     assert overlapping_turn.overlaps_with(basic_turn) is True
     # No overlap
-    t2 = Turn(
-        speaker=["SPEAKER_02"],
-        text="No overlap",
-        start_time=10.0,
-        end_time=12.0,
-        duration=2.0,
-        turn_count=3,
-    )
+    t2 = _turn(speaker=["SPEAKER_02"], text="No overlap", start_time=10.0,
+               end_time=12.0, duration=2.0, turn_count=3)
     assert basic_turn.overlaps_with(t2) is False
     assert t2.overlaps_with(basic_turn) is False
 
-def test_turn_validation_errors():
-    # Negative start time
-    with pytest.raises(ValueError):
-        Turn(speaker=["SPEAKER_00"], text="x", start_time=-1, end_time=1, duration=2, turn_count=1)
-    # End time before start time
-    with pytest.raises(ValueError):
-        Turn(speaker=["SPEAKER_00"], text="x", start_time=2, end_time=1, duration=2, turn_count=1)
-    # Negative duration
-    with pytest.raises(ValueError):
-        Turn(speaker=["SPEAKER_00"], text="x", start_time=0, end_time=1, duration=-1, turn_count=1)
+@pytest.mark.parametrize("overrides", [
+    pytest.param(dict(start_time=-1), id="negative_start"),
+    pytest.param(dict(start_time=2, end_time=1), id="end_before_start"),
+    pytest.param(dict(duration=-1), id="negative_duration"),
     # A missing speaker list is still a broken record
+    pytest.param(dict(speaker=None), id="missing_speaker"),
+    pytest.param(dict(text="   "), id="blank_text"),
+])
+def test_turn_validation_errors(overrides):
     with pytest.raises(ValueError):
-        Turn(speaker=None, text="x", start_time=0, end_time=1, duration=1, turn_count=1)
-    # Empty text
-    with pytest.raises(ValueError):
-        Turn(speaker=["SPEAKER_00"], text="   ", start_time=0, end_time=1, duration=1, turn_count=1)
+        _turn(**overrides)
 
 
 def test_turn_with_no_speakers_is_allowed():
@@ -156,7 +161,7 @@ def test_token_count_from_pandas_float_is_an_int():
 
 
 def test_turn_zero_duration():
-    t = Turn(speaker=["SPEAKER_00"], text="oneword", start_time=0, end_time=0, duration=0, turn_count=1)
+    t = _turn(text="oneword", end_time=0, duration=0)
     assert t.words_per_second == 0.0
     assert t.word_count == 1
 
@@ -169,13 +174,6 @@ def test_turn_zero_duration():
 # the properties that avoid it are tested against every value they can see.
 # ---------------------------------------------------------------------------
 
-def _turn(**kw):
-    base = dict(speaker=["SPEAKER_00"], text="words here", start_time=0.0,
-                end_time=1.0, duration=1.0, turn_count=0)
-    base.update(kw)
-    return Turn(**base)
-
-
 @pytest.mark.parametrize("name,expected", [
     ("Ira Glass", True),
     ("NO_INFERRED_SPEAKER", False),
@@ -222,3 +220,11 @@ def test_to_dict_carries_the_sentinel_flags():
               inferred_speaker_role="host").to_dict()
     assert d["has_inferred_speaker"] is False
     assert d["has_inferred_role"] is True
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_turn_has_no_instance_dict(basic_turn):
+    assert not hasattr(basic_turn, "__dict__")
+    with pytest.raises(AttributeError):
+        basic_turn.not_a_field = 1
+    assert pickle.loads(pickle.dumps(basic_turn)) == basic_turn